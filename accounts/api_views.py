@@ -22,21 +22,8 @@ def api_login(request):
             'error': 'Email and password are required'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # Try to find user by email or username
-    from .models import User
-    user = None
-    try:
-        if '@' in email:
-            user = User.objects.get(email=email)
-        else:
-            user = User.objects.get(username=email)
-    except User.DoesNotExist:
-        return Response({
-            'error': 'Invalid credentials'
-        }, status=status.HTTP_401_UNAUTHORIZED)
-    
-    # Authenticate user
-    authenticated_user = authenticate(request, username=user.email, password=password)
+    # Email or username is resolved by the auth backend in one query
+    authenticated_user = authenticate(request, username=email, password=password)
     
     if authenticated_user:
         # Get or create token
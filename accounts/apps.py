@@ -3,4 +3,9 @@ from django.apps import AppConfig
 
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'accounts'
\ No newline at end of file
+    name = 'accounts'
+
+    def ready(self):
+        from .backends import connect_permission_cache_signals
+
+        connect_permission_cache_signals()
@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from itms_app.cache import bump_model_version, bump_version, get_model_version, get_version
+
+UserModel = get_user_model()
+
+# L1: per-process permission sets, short-lived so other workers' changes show up quickly
+PERMISSION_L1_TTL = 5
+PERMISSION_L1_MAX = 1024
+# L2: shared cache (Redis) so every worker reuses one lookup
+PERMISSION_L2_TTL = 300
+
+# user pk -> (expires_at, frozenset of perms), oldest first so eviction is LRU
+_permission_l1 = OrderedDict()
+_permission_l1_lock = threading.Lock()
+
+
+def _user_version_key(user_pk):
+    return f'itms:perms:version:{user_pk}'
+
+
+def _permission_cache_key(user_pk):
+    # The Group version changes whenever any group's permissions change, the
+    # user version whenever this user's own groups or permissions change
+    return f'itms:perms:{get_model_version(Group)}:{get_version(_user_version_key(user_pk))}:{user_pk}'
+
+
+def _drop_user_permissions(user_pk):
+    with _permission_l1_lock:
+        _permission_l1.pop(user_pk, None)
+    # Bump rather than delete: a request that read the old rows before the
+    # commit would otherwise write them back under the same key
+    bump_version(_user_version_key(user_pk))
+
+
+def invalidate_user_permissions(user_pk):
+    """
+    ลบ permission cache ของ user ทั้ง L1 และ L2 หลัง transaction ปัจจุบัน commit
+    """
+    # Bumping before commit lets a concurrent request cache the old rows under the new version
+    transaction.on_commit(lambda: _drop_user_permissions(user_pk))
+
+
+def _drop_all_permissions():
+    # New L2 keys for everyone; other workers' L1 entries run out within PERMISSION_L1_TTL
+    bump_model_version(Group)
+    with _permission_l1_lock:
+        _permission_l1.clear()
+
+
+def _user_changed(sender, instance, **kwargs):
+    invalidate_user_permissions(instance.pk)
+
+
+def _user_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        invalidate_user_permissions(instance.pk)
+    elif pk_set:
+        for user_pk in pk_set:
+            invalidate_user_permissions(user_pk)
+    else:
+        # group.user_set.clear(): we don't know which users were affected
+        transaction.on_commit(_drop_all_permissions)
+
+
+def _group_deleted(sender, **kwargs):
+    transaction.on_commit(_drop_all_permissions)
+
+
+def _group_permissions_changed(sender, action, **kwargs):
+    # A group's permissions changed: every member's cached set may be stale
+    if action.startswith('post_'):
+        transaction.on_commit(_drop_all_permissions)
+
+
+def connect_permission_cache_signals():
+    """
+    ผูก signals ที่ทำให้ permission cache หมดอายุเมื่อ user/group/permission เปลี่ยน
+    """
+    post_save.connect(_user_changed, sender=UserModel, dispatch_uid='itms-perms-user-save')
+    post_delete.connect(_user_changed, sender=UserModel, dispatch_uid='itms-perms-user-delete')
+    post_delete.connect(_group_deleted, sender=Group, dispatch_uid='itms-perms-group-delete')
+    for through in (UserModel.groups.through, UserModel.user_permissions.through):
+        m2m_changed.connect(_user_m2m_changed, sender=through, dispatch_uid=f'itms-perms-{through._meta.label_lower}')
+    m2m_changed.connect(_group_permissions_changed, sender=Group.permissions.through, dispatch_uid='itms-perms-group-permissions')
+
+
+class EmailOrUsernameBackend(ModelBackend):
+    """
+    Authenticate with either email or username in a single indexed lookup
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        # email and username are both unique, so this hits at most two rows
+        candidates = list(
+            UserModel._default_manager.filter(
+                Q(email=username) | Q(username=username)
+            )[:2]
+        )
+        if not candidates:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user
+            UserModel().set_password(password)
+            return None
+
+        # Prefer the email match when one user's username equals another's email
+        user = next((u for u in candidates if u.email == username), candidates[0])
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
+
+    def get_all_permissions(self, user_obj, obj=None):
+        """
+        Permission set ของ user ผ่าน cache สองชั้น (L1 in-process, L2 shared cache)
+        ก่อนจะ query ตาราง permissions จริง
+        """
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if hasattr(user_obj, '_perm_cache'):
+            return user_obj._perm_cache
+
+        now = time.monotonic()
+        with _permission_l1_lock:
+            entry = _permission_l1.get(user_obj.pk)
+            if entry is not None:
+                _permission_l1.move_to_end(user_obj.pk)
+        if entry is not None and entry[0] > now:
+            perms = entry[1]
+        else:
+            # Read the versions before querying so a concurrent invalidation
+            # leaves this lookup's write under a dead key
+            key = _permission_cache_key(user_obj.pk)
+            perms = cache.get(key)
+            if perms is None:
+                # Shared by every later request, so hand out an immutable set
+                perms = frozenset(super().get_all_permissions(user_obj))
+                cache.set(key, perms, PERMISSION_L2_TTL)
+            else:
+                # No-op for frozensets; guards entries written as plain sets
+                perms = frozenset(perms)
+            with _permission_l1_lock:
+                _permission_l1[user_obj.pk] = (now + PERMISSION_L1_TTL, perms)
+                _permission_l1.move_to_end(user_obj.pk)
+                # Evict the least recently used users instead of dropping them all
+                while len(_permission_l1) > PERMISSION_L1_MAX:
+                    _permission_l1.popitem(last=False)
+
+        user_obj._perm_cache = perms
+        return perms
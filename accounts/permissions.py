@@ -2,6 +2,7 @@
 from django.contrib.auth.models import Permission, Group
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import Count
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -268,14 +269,8 @@ class ITMSPermissionManager:
                             
                             # Handle specific models for auth app to avoid duplicates
                             if app_label == 'auth':
-                                if codename.startswith('add_user') or codename.startswith('change_user') or codename.startswith('delete_user') or codename.startswith('view_user'):
-                                    model_name = 'user'
-                                elif codename.startswith('add_group') or codename.startswith('change_group') or codename.startswith('delete_group') or codename.startswith('view_group'):
-                                    model_name = 'group'  
-                                elif codename.startswith('add_permission') or codename.startswith('change_permission') or codename.startswith('delete_permission') or codename.startswith('view_permission'):
-                                    model_name = 'permission'
-                                else:
-                                    model_name = codename.split('_', 1)[1] if '_' in codename else 'user'
+                                # Codenames are '<action>_<model>', so the model is everything after the first '_'
+                                model_name = codename.partition('_')[2] or 'user'
                                 
                                 content_type = ContentType.objects.filter(
                                     app_label=app_label, 
@@ -309,23 +304,37 @@ class ITMSPermissionManager:
         
         return created_groups
     
+    @staticmethod
+    def get_user_group_names(user):
+        """
+        ดึงชื่อ Groups ของ User เป็น frozenset และ cache ไว้บน user object
+        (query ครั้งเดียวต่อ request แทนการ query ทุกครั้งที่ตรวจสิทธิ์)
+        """
+        group_names = getattr(user, '_itms_group_names', None)
+        if group_names is None:
+            group_names = frozenset(user.groups.values_list('name', flat=True))
+            user._itms_group_names = group_names
+        return group_names
+    
     @classmethod
     def get_user_group_info(cls, user):
         """
         ดึงข้อมูล Groups ของ User พร้อมสีและคำอธิบาย
         """
-        user_groups = user.groups.all()
+        # Only the permission count is needed, so count in SQL rather than per group
+        user_groups = user.groups.filter(
+            name__in=cls.PERMISSION_GROUPS
+        ).annotate(permissions_count=Count('permissions'))
         group_info = []
         
         for group in user_groups:
-            if group.name in cls.PERMISSION_GROUPS:
-                group_data = cls.PERMISSION_GROUPS[group.name]
-                group_info.append({
-                    'name': group.name,
-                    'description': group_data['description'],
-                    'color': group_data['color'],
-                    'permissions_count': group.permissions.count()
-                })
+            group_data = cls.PERMISSION_GROUPS[group.name]
+            group_info.append({
+                'name': group.name,
+                'description': group_data['description'],
+                'color': group_data['color'],
+                'permissions_count': group.permissions_count
+            })
         
         return group_info
     
@@ -334,24 +343,27 @@ class ITMSPermissionManager:
         """
         ดึงสรุป Groups ทั้งหมดในระบบ
         """
-        summary = []
+        # One query for every group's counts instead of four queries per group
+        counts = {
+            group['name']: group
+            for group in Group.objects.filter(
+                name__in=cls.PERMISSION_GROUPS
+            ).annotate(
+                user_count=Count('user', distinct=True),
+                permissions_count=Count('permissions', distinct=True),
+            ).values('name', 'user_count', 'permissions_count')
+        }
         
+        summary = []
         for group_name, group_data in cls.PERMISSION_GROUPS.items():
-            try:
-                group = Group.objects.get(name=group_name)
-                user_count = group.user_set.count()
-                perm_count = group.permissions.count()
-            except Group.DoesNotExist:
-                user_count = 0
-                perm_count = 0
-            
+            group = counts.get(group_name)
             summary.append({
                 'name': group_name,
                 'description': group_data['description'],
                 'color': group_data['color'],
-                'user_count': user_count,
-                'permissions_count': perm_count,
-                'exists': Group.objects.filter(name=group_name).exists()
+                'user_count': group['user_count'] if group else 0,
+                'permissions_count': group['permissions_count'] if group else 0,
+                'exists': group is not None
             })
         
         return summary
@@ -381,7 +393,7 @@ class ITMSAdminPermissionMixin:
         
         # Object-level permission check
         if obj and hasattr(obj, 'created_by'):
-            if obj.created_by == request.user:
+            if obj.created_by_id == request.user.pk:
                 return True
         
         return super().has_change_permission(request, obj)
@@ -392,7 +404,7 @@ class ITMSAdminPermissionMixin:
             return True
         
         # Only allow deletion by IT Administrators
-        if request.user.groups.filter(name='IT_Administrators').exists():
+        if 'IT_Administrators' in ITMSPermissionManager.get_user_group_names(request.user):
             return True
         
         return False
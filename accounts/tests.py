@@ -0,0 +1,130 @@
+from unittest import mock
+
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Group, Permission
+
+from itms.testing import CacheTestCase, make_user
+
+from .backends import EmailOrUsernameBackend, _permission_l1
+
+User = get_user_model()
+
+
+class EmailOrUsernameBackendTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = make_user('somchai', 'somchai@example.com')
+
+    def test_login_with_email(self):
+        self.assertEqual(authenticate(username='somchai@example.com', password='secret-pass'), self.user)
+
+    def test_login_with_username(self):
+        self.assertEqual(authenticate(username='somchai', password='secret-pass'), self.user)
+
+    def test_wrong_password(self):
+        self.assertIsNone(authenticate(username='somchai', password='wrong'))
+
+    def test_unknown_user(self):
+        self.assertIsNone(authenticate(username='nobody', password='secret-pass'))
+
+    def test_email_match_wins_when_identifier_is_ambiguous(self):
+        # Another account uses this user's email address as its username
+        other = make_user('somchai@example.com', 'other@example.com', password='other-pass')
+
+        self.assertEqual(authenticate(username='somchai@example.com', password='secret-pass'), self.user)
+        # The username match is never tried, even with that account's password
+        self.assertIsNone(authenticate(username='somchai@example.com', password='other-pass'))
+        self.assertEqual(authenticate(username='other@example.com', password='other-pass'), other)
+
+
+class PermissionCacheTests(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        _permission_l1.clear()
+        self.backend = EmailOrUsernameBackend()
+        self.user = make_user('somchai', 'somchai@example.com')
+        self.view_user = Permission.objects.get(content_type__app_label='accounts', codename='view_user')
+        self.change_user = Permission.objects.get(content_type__app_label='accounts', codename='change_user')
+        self.user.user_permissions.add(self.view_user)
+        self.group = Group.objects.create(name='Technicians')
+
+    def perms(self):
+        # A fresh instance each time so the per-object _perm_cache doesn't hide the lookup
+        return self.backend.get_all_permissions(User.objects.get(pk=self.user.pk))
+
+    def test_l1_hit_skips_database(self):
+        self.assertEqual(self.perms(), {'accounts.view_user'})
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            perms = self.backend.get_all_permissions(user)
+        self.assertIsInstance(perms, frozenset)
+        self.assertEqual(perms, {'accounts.view_user'})
+
+    def test_l2_hit_skips_database(self):
+        self.perms()
+        # Another worker: empty L1, shared L2
+        _permission_l1.clear()
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            perms = self.backend.get_all_permissions(user)
+        self.assertEqual(perms, {'accounts.view_user'})
+
+    def test_l1_evicts_least_recently_used(self):
+        other = make_user('somsri', 'somsri@example.com')
+        with mock.patch('accounts.backends.PERMISSION_L1_MAX', 1):
+            self.perms()
+            self.backend.get_all_permissions(User.objects.get(pk=other.pk))
+
+        self.assertEqual(list(_permission_l1), [other.pk])
+
+    def test_user_permission_change_invalidates_after_commit(self):
+        self.perms()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.user_permissions.add(self.change_user)
+        # Nothing is dropped until the transaction commits
+        self.assertEqual(self.perms(), {'accounts.view_user'})
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.perms(), {'accounts.view_user', 'accounts.change_user'})
+
+    def test_late_write_after_invalidation_is_not_served(self):
+        read_rows = ModelBackend.get_all_permissions
+
+        def revoke_during_lookup(backend, user_obj, obj=None):
+            # The lookup reads the old rows, then the revocation commits
+            # before the lookup writes them to the shared cache
+            perms = read_rows(backend, user_obj, obj)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.user.user_permissions.remove(self.view_user)
+            return perms
+
+        with mock.patch.object(ModelBackend, 'get_all_permissions', revoke_during_lookup):
+            self.assertEqual(self.perms(), {'accounts.view_user'})
+
+        # Another worker: empty L1, shared L2
+        _permission_l1.clear()
+        self.assertEqual(self.perms(), set())
+
+    def test_group_permission_change_invalidates_members(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.groups.add(self.group)
+        self.perms()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.permissions.add(self.change_user)
+        self.assertEqual(self.perms(), {'accounts.view_user', 'accounts.change_user'})
+
+    def test_group_delete_invalidates_members(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.permissions.add(self.change_user)
+            self.user.groups.add(self.group)
+        self.assertEqual(self.perms(), {'accounts.view_user', 'accounts.change_user'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.group.delete()
+        self.assertEqual(self.perms(), {'accounts.view_user'})
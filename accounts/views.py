@@ -7,12 +7,110 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.core.validators import validate_email
 from django.db import transaction
+from django.conf import settings
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Q, Sum
+from django.db.models import Count, Exists, OuterRef, Q, Sum
 from django.db import models
 from datetime import datetime, timedelta
 import re
 
+from itms_app.cache import get_model_version
+from itms_app.models import (
+    Asset, Category, HelpDeskTicket, Location, MaintenanceRecord, Reservation,
+    SoftwareInstallation, SoftwareLicense, Vendor,
+)
+
+# Static form options, built once at import instead of on every request
+COMMON_LICENSE_TYPES = (
+    'Per User',
+    'Per Device',
+    'Site License',
+    'Enterprise License',
+    'Academic License',
+    'Concurrent License',
+    'Subscription',
+    'Perpetual License',
+)
+
+# Valid status values for membership checks on POSTed status updates
+TICKET_STATUSES = frozenset(value for value, _ in HelpDeskTicket.STATUS_CHOICES)
+RESERVATION_STATUSES = frozenset(value for value, _ in Reservation.RESERVATION_STATUS_CHOICES)
+
+VENDOR_EDITABLE_FIELDS = ('name', 'contact_person', 'email', 'phone', 'address')
+
+VENDOR_SORT_OPTIONS = {
+    'name': 'name',
+    'assets': '-assets_count',
+    'licenses': '-licenses_count',
+    'maintenance': '-maintenance_count',
+    'cost': '-total_license_cost',
+}
+
+# Input formats used by the HTML date and datetime-local fields
+DATE_INPUT_FORMAT = '%Y-%m-%d'
+DATETIME_INPUT_FORMAT = '%Y-%m-%dT%H:%M'
+
+
+def parse_date_input(value):
+    """Parse a 'YYYY-MM-DD' form value into a date (raises ValueError)"""
+    return datetime.strptime(value, DATE_INPUT_FORMAT).date()
+
+
+def parse_local_datetime(value):
+    """Parse a datetime-local form value into an aware datetime (raises ValueError)"""
+    return timezone.make_aware(datetime.strptime(value, DATETIME_INPUT_FORMAT))
+
+
+def local_day_range(value):
+    """
+    Turn a 'YYYY-MM-DD' filter value into an aware [start, end) range for that
+    local day, so DateTimeField filters can use an index instead of __date
+    """
+    day_start = timezone.make_aware(datetime.strptime(value, DATE_INPUT_FORMAT))
+    return day_start, day_start + timedelta(days=1)
+
+
+def get_maintenance_summary(now):
+    """
+    Header statistics of the maintenance page. They don't depend on the list
+    filters, so they are cached until a maintenance record or asset changes
+    (or the 'normal' TTL passes, which bounds the drift of the 30-day window)
+    """
+    cache_key = 'itms:maintenance-summary:%s:%s' % (
+        get_model_version(MaintenanceRecord), get_model_version(Asset)
+    )
+    summary = cache.get(cache_key)
+    if summary is not None:
+        return summary
+
+    month_start = timezone.localtime(now).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    summary = MaintenanceRecord.objects.aggregate(
+        total=Count('id'),
+        this_month=Count('id', filter=Q(
+            maintenance_date__gte=month_start,
+            maintenance_date__lt=next_month_start
+        )),
+        preventive=Count('id', filter=Q(maintenance_type='preventive')),
+        corrective=Count('id', filter=Q(maintenance_type='corrective')),
+        emergency=Count('id', filter=Q(maintenance_type='emergency')),
+        total_cost=Sum('cost'),
+        avg_cost=models.Avg('cost'),
+    )
+
+    # Recent maintenance (assets that need attention)
+    thirty_days_ago = now - timedelta(days=30)
+    summary['recent_assets'] = Asset.objects.filter(
+        maintenance_records__maintenance_date__gte=thirty_days_ago
+    ).distinct().count()
+    summary['overdue_assets'] = Asset.objects.exclude(
+        maintenance_records__maintenance_date__gte=thirty_days_ago
+    ).filter(status='active').count()
+
+    cache.set(cache_key, summary, settings.CACHE_TTL['normal'])
+    return summary
+
 
 def login_view(request):
     if request.user.is_authenticated:
@@ -27,52 +125,27 @@ def login_view(request):
             messages.error(request, 'Please provide both username/email and password.')
             return render(request, 'accounts/login.html')
         
-        # Try to find user by email first, then by username
-        user = None
-        try:
-            if '@' in login_input:
-                # If input contains @, treat as email
-                user = User.objects.get(email=login_input)
-            else:
-                # Otherwise, treat as username
-                user = User.objects.get(username=login_input)
-        except User.DoesNotExist:
-            # If first attempt failed, try the other method
-            try:
-                if '@' in login_input:
-                    user = User.objects.get(username=login_input)
-                else:
-                    user = User.objects.get(email=login_input)
-            except User.DoesNotExist:
-                pass
+        # Email or username is resolved by the auth backend in one query
+        authenticated_user = authenticate(request, username=login_input, password=password)
         
-        if user:
-            # Authenticate using email (since USERNAME_FIELD = 'email')
-            authenticated_user = authenticate(request, username=user.email, password=password)
+        if authenticated_user is not None:
+            login(request, authenticated_user)
             
-            if authenticated_user is not None:
-                if authenticated_user.is_active:
-                    login(request, authenticated_user)
-                    
-                    # Handle "Remember Me" functionality
-                    if remember_me:
-                        request.session.set_expiry(1209600)  # 2 weeks
-                    else:
-                        request.session.set_expiry(0)  # Browser close
-                    
-                    # Update last login
-                    authenticated_user.last_login = timezone.now()
-                    authenticated_user.save(update_fields=['last_login'])
-                    
-                    messages.success(request, f'Welcome back, {authenticated_user.first_name or authenticated_user.username}!')
-                    
-                    # Redirect to next page if available
-                    next_page = request.GET.get('next', 'dashboard')
-                    return redirect(next_page)
-                else:
-                    messages.error(request, 'Your account has been deactivated. Please contact administrator.')
+            # Handle "Remember Me" functionality
+            if remember_me:
+                request.session.set_expiry(1209600)  # 2 weeks
             else:
-                messages.error(request, 'Invalid username/email or password.')
+                request.session.set_expiry(0)  # Browser close
+            
+            # Update last login
+            authenticated_user.last_login = timezone.now()
+            authenticated_user.save(update_fields=['last_login'])
+            
+            messages.success(request, f'Welcome back, {authenticated_user.first_name or authenticated_user.username}!')
+            
+            # Redirect to next page if available
+            next_page = request.GET.get('next', 'dashboard')
+            return redirect(next_page)
         else:
             messages.error(request, 'Invalid username/email or password.')
     
@@ -163,52 +236,74 @@ def signup_view(request):
 
 @login_required
 def dashboard(request):
-    from itms_app.models import Asset, HelpDeskTicket, SoftwareLicense, MaintenanceRecord, Category, Location, Vendor
-    from django.db.models import Count, Q, Sum
-    from datetime import datetime, timedelta
-    
-    # Get current date for time-based calculations
-    now = datetime.now()
+    # Get current date for time-based calculations (aware, so filters on
+    # DateTimeFields don't go through the naive-datetime conversion)
+    now = timezone.now()
     thirty_days_ago = now - timedelta(days=30)
     
-    # Asset statistics
-    total_assets = Asset.objects.count()
-    active_assets = Asset.objects.filter(status='active').count()
-    maintenance_assets = Asset.objects.filter(status='maintenance').count()
-    retired_assets = Asset.objects.filter(status='retired').count()
-    disposed_assets = Asset.objects.filter(status='disposed').count()
-    inactive_assets = Asset.objects.filter(status='inactive').count()
-    
-    # Ticket statistics
-    total_tickets = HelpDeskTicket.objects.count()
-    open_tickets = HelpDeskTicket.objects.filter(status='open').count()
-    in_progress_tickets = HelpDeskTicket.objects.filter(status='in_progress').count()
-    resolved_tickets = HelpDeskTicket.objects.filter(status='resolved').count()
-    closed_tickets = HelpDeskTicket.objects.filter(status='closed').count()
-    pending_tickets = HelpDeskTicket.objects.filter(status='pending').count()
-    
-    # Critical and high priority tickets
-    critical_tickets = HelpDeskTicket.objects.filter(priority='critical', status__in=['open', 'in_progress']).count()
-    high_priority_tickets = HelpDeskTicket.objects.filter(priority='high', status__in=['open', 'in_progress']).count()
-    
-    # Software license statistics  
-    total_licenses = SoftwareLicense.objects.count()
-    expiring_licenses = SoftwareLicense.objects.filter(
-        expiry_date__lte=now + timedelta(days=30),
-        expiry_date__gte=now
-    ).count()
-    
-    # License utilization
-    license_utilization = SoftwareLicense.objects.aggregate(
+    # Asset statistics (one conditional aggregate instead of a COUNT per status)
+    asset_stats = Asset.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(status='active')),
+        maintenance=Count('id', filter=Q(status='maintenance')),
+        retired=Count('id', filter=Q(status='retired')),
+        disposed=Count('id', filter=Q(status='disposed')),
+        inactive=Count('id', filter=Q(status='inactive')),
+        new=Count('id', filter=Q(created_at__gte=thirty_days_ago)),
+    )
+    total_assets = asset_stats['total']
+    active_assets = asset_stats['active']
+    maintenance_assets = asset_stats['maintenance']
+    retired_assets = asset_stats['retired']
+    disposed_assets = asset_stats['disposed']
+    inactive_assets = asset_stats['inactive']
+    new_assets_count = asset_stats['new']
+    
+    # Ticket statistics, including critical and high priority open tickets
+    open_work = Q(status__in=['open', 'in_progress'])
+    ticket_stats = HelpDeskTicket.objects.aggregate(
+        total=Count('id'),
+        open=Count('id', filter=Q(status='open')),
+        in_progress=Count('id', filter=Q(status='in_progress')),
+        resolved=Count('id', filter=Q(status='resolved')),
+        closed=Count('id', filter=Q(status='closed')),
+        pending=Count('id', filter=Q(status='pending')),
+        critical=Count('id', filter=Q(priority='critical') & open_work),
+        high=Count('id', filter=Q(priority='high') & open_work),
+    )
+    total_tickets = ticket_stats['total']
+    open_tickets = ticket_stats['open']
+    in_progress_tickets = ticket_stats['in_progress']
+    resolved_tickets = ticket_stats['resolved']
+    closed_tickets = ticket_stats['closed']
+    pending_tickets = ticket_stats['pending']
+    critical_tickets = ticket_stats['critical']
+    high_priority_tickets = ticket_stats['high']
+    
+    # Software license statistics and utilization
+    license_stats = SoftwareLicense.objects.aggregate(
+        total=Count('id'),
+        expiring=Count('id', filter=Q(
+            expiry_date__lte=now + timedelta(days=30),
+            expiry_date__gte=now
+        )),
         total_installations=Sum('max_installations'),
-        current_installations=Sum('current_installations')
+        current_installations=Sum('current_installations'),
     )
+    total_licenses = license_stats['total']
+    expiring_licenses = license_stats['expiring']
+    license_utilization = {
+        'total_installations': license_stats['total_installations'],
+        'current_installations': license_stats['current_installations'],
+    }
     
     # Maintenance statistics
-    total_maintenance = MaintenanceRecord.objects.count()
-    recent_maintenance_count = MaintenanceRecord.objects.filter(
-        maintenance_date__gte=thirty_days_ago
-    ).count()
+    maintenance_stats = MaintenanceRecord.objects.aggregate(
+        total=Count('id'),
+        recent=Count('id', filter=Q(maintenance_date__gte=thirty_days_ago)),
+    )
+    total_maintenance = maintenance_stats['total']
+    recent_maintenance_count = maintenance_stats['recent']
     
     # Recent maintenance records
     recent_maintenance = MaintenanceRecord.objects.select_related(
@@ -233,9 +328,6 @@ def dashboard(request):
     # Asset status breakdown  
     asset_status_data = Asset.objects.values('status').annotate(count=Count('status'))
     
-    # Recent asset additions
-    new_assets_count = Asset.objects.filter(created_at__gte=thirty_days_ago).count()
-    
     # System overview stats
     total_categories = Category.objects.count()
     total_locations = Location.objects.count() 
@@ -297,10 +389,6 @@ def dashboard(request):
 
 @login_required
 def assets_view(request):
-    from itms_app.models import Asset, Category, Location, Vendor
-    from django.db.models import Q
-    from django.core.paginator import Paginator
-    
     # Get filter parameters
     search_query = request.GET.get('search', '')
     category_filter = request.GET.get('category', '')
@@ -350,7 +438,7 @@ def assets_view(request):
         'category_filter': category_filter,
         'status_filter': status_filter,
         'location_filter': location_filter,
-        'total_assets': assets.count(),
+        'total_assets': paginator.count,
     }
     
     return render(request, 'accounts/assets.html', context)
@@ -358,9 +446,6 @@ def assets_view(request):
 
 @login_required
 def asset_detail_view(request, asset_id):
-    from itms_app.models import Asset, MaintenanceRecord
-    from django.shortcuts import get_object_or_404
-    
     asset = get_object_or_404(Asset, id=asset_id)
     maintenance_records = MaintenanceRecord.objects.filter(asset=asset).select_related('performed_by').order_by('-maintenance_date')[:5]
     
@@ -375,10 +460,6 @@ def asset_detail_view(request, asset_id):
 
 @login_required
 def helpdesk_view(request):
-    from itms_app.models import HelpDeskTicket, Category, Asset
-    from django.db.models import Q
-    from django.core.paginator import Paginator
-    
     # Get filter parameters
     search_query = request.GET.get('search', '')
     status_filter = request.GET.get('status', '')
@@ -437,7 +518,7 @@ def helpdesk_view(request):
         'priority_filter': priority_filter,
         'category_filter': category_filter,
         'assigned_filter': assigned_filter,
-        'total_tickets': tickets.count(),
+        'total_tickets': paginator.count,
     }
     
     return render(request, 'accounts/helpdesk.html', context)
@@ -445,10 +526,6 @@ def helpdesk_view(request):
 
 @login_required
 def ticket_detail_view(request, ticket_id):
-    from itms_app.models import HelpDeskTicket
-    from django.shortcuts import get_object_or_404
-    from django.contrib import messages
-    
     ticket = get_object_or_404(HelpDeskTicket, id=ticket_id)
     
     # Handle status updates
@@ -456,18 +533,25 @@ def ticket_detail_view(request, ticket_id):
         new_status = request.POST.get('status')
         resolution = request.POST.get('resolution', '')
         
-        if new_status and new_status in [choice[0] for choice in HelpDeskTicket.STATUS_CHOICES]:
+        if new_status in TICKET_STATUSES:
             old_status = ticket.status
             ticket.status = new_status
+            # Write back only the columns this form can touch
+            update_fields = ['status', 'updated_at']
             
-            if new_status == 'resolved' and resolution:
-                ticket.resolution = resolution
+            if new_status == 'resolved':
+                # HelpDeskTicket.save() stamps resolved_at on first resolve
+                update_fields.append('resolved_at')
+                if resolution:
+                    ticket.resolution = resolution
+                    update_fields.append('resolution')
             
             # Assign to current user if taking ownership
-            if new_status == 'in_progress' and not ticket.assigned_to:
+            if new_status == 'in_progress' and not ticket.assigned_to_id:
                 ticket.assigned_to = request.user
+                update_fields.append('assigned_to')
             
-            ticket.save()
+            ticket.save(update_fields=update_fields)
             messages.success(request, f'Ticket status updated from {old_status} to {new_status}')
             return redirect('ticket_detail', ticket_id=ticket.id)
     
@@ -482,12 +566,6 @@ def ticket_detail_view(request, ticket_id):
 
 @login_required
 def create_ticket_view(request):
-    from itms_app.models import HelpDeskTicket, Category, Asset
-    from django.contrib import messages
-    from django.contrib.auth import get_user_model
-    
-    User = get_user_model()
-    
     if request.method == 'POST':
         title = request.POST.get('title', '').strip()
         description = request.POST.get('description', '').strip()
@@ -554,8 +632,6 @@ def create_ticket_view(request):
 
 @login_required
 def reservations_view(request):
-    from itms_app.models import Reservation, Asset, Category
-    
     # Get filter parameters
     search = request.GET.get('search', '').strip()
     asset_filter = request.GET.get('asset', '').strip()
@@ -587,8 +663,11 @@ def reservations_view(request):
     
     if date_filter:
         try:
-            filter_date = datetime.strptime(date_filter, '%Y-%m-%d').date()
-            reservations = reservations.filter(start_datetime__date=filter_date)
+            day_start, day_end = local_day_range(date_filter)
+            reservations = reservations.filter(
+                start_datetime__gte=day_start,
+                start_datetime__lt=day_end
+            )
         except ValueError:
             pass
     
@@ -607,14 +686,21 @@ def reservations_view(request):
     status_choices = Reservation.RESERVATION_STATUS_CHOICES
     
     # Get counts for dashboard
-    total_reservations = Reservation.objects.count()
-    pending_reservations = Reservation.objects.filter(status='pending').count()
-    approved_reservations = Reservation.objects.filter(status='approved').count()
-    active_reservations = Reservation.objects.filter(
-        status='approved',
-        start_datetime__lte=timezone.now(),
-        end_datetime__gte=timezone.now()
-    ).count()
+    now = timezone.now()
+    reservation_stats = Reservation.objects.aggregate(
+        total=Count('id'),
+        pending=Count('id', filter=Q(status='pending')),
+        approved=Count('id', filter=Q(status='approved')),
+        active=Count('id', filter=Q(
+            status='approved',
+            start_datetime__lte=now,
+            end_datetime__gte=now
+        )),
+    )
+    total_reservations = reservation_stats['total']
+    pending_reservations = reservation_stats['pending']
+    approved_reservations = reservation_stats['approved']
+    active_reservations = reservation_stats['active']
     
     context = {
         'user': request.user,
@@ -638,8 +724,6 @@ def reservations_view(request):
 
 @login_required
 def create_reservation_view(request):
-    from itms_app.models import Reservation, Asset, Category
-    
     if request.method == 'POST':
         title = request.POST.get('title', '').strip()
         description = request.POST.get('description', '').strip()
@@ -677,15 +761,13 @@ def create_reservation_view(request):
         end_dt = None
         if start_datetime:
             try:
-                start_dt = datetime.strptime(start_datetime, '%Y-%m-%dT%H:%M')
-                start_dt = timezone.make_aware(start_dt)
+                start_dt = parse_local_datetime(start_datetime)
             except ValueError:
                 errors.append('Invalid start date/time format.')
         
         if end_datetime:
             try:
-                end_dt = datetime.strptime(end_datetime, '%Y-%m-%dT%H:%M')
-                end_dt = timezone.make_aware(end_dt)
+                end_dt = parse_local_datetime(end_datetime)
             except ValueError:
                 errors.append('Invalid end date/time format.')
         
@@ -696,11 +778,11 @@ def create_reservation_view(request):
             if start_dt < timezone.now():
                 errors.append('Start time cannot be in the past.')
             
-            # Check for conflicts
+            # Check for conflicts (served by the asset/status/start_datetime index)
             try:
                 asset = Asset.objects.get(id=asset_id)
                 conflicts = Reservation.objects.filter(
-                    asset=asset,
+                    asset_id=asset.id,
                     status__in=['pending', 'approved'],
                     start_datetime__lt=end_dt,
                     end_datetime__gt=start_dt
@@ -716,8 +798,7 @@ def create_reservation_view(request):
                 messages.error(request, error)
         else:
             try:
-                asset = Asset.objects.get(id=asset_id)
-                
+                # No errors means the conflict check above already loaded the asset
                 reservation = Reservation.objects.create(
                     title=title,
                     description=description,
@@ -758,8 +839,6 @@ def create_reservation_view(request):
 
 @login_required
 def reservation_detail_view(request, reservation_id):
-    from itms_app.models import Reservation
-    
     reservation = get_object_or_404(Reservation, id=reservation_id)
     
     # Handle status updates (for staff only or reservation owner for cancellation)
@@ -775,7 +854,7 @@ def reservation_detail_view(request, reservation_id):
         elif request.user == reservation.reserved_by and new_status == 'cancelled':
             can_update = reservation.can_be_cancelled()
         
-        if can_update and new_status in [choice[0] for choice in Reservation.RESERVATION_STATUS_CHOICES]:
+        if can_update and new_status in RESERVATION_STATUSES:
             old_status = reservation.status
             reservation.status = new_status
             
@@ -818,8 +897,6 @@ def reservation_detail_view(request, reservation_id):
 
 @login_required
 def software_licenses_view(request):
-    from itms_app.models import SoftwareLicense, SoftwareInstallation, Vendor
-    
     # Get filter parameters
     search = request.GET.get('search', '').strip()
     vendor_filter = request.GET.get('vendor', '').strip()
@@ -854,7 +931,6 @@ def software_licenses_view(request):
         licenses = licenses.filter(expiry_date__lt=today)
     elif status_filter == 'expiring':
         # Expiring within 30 days
-        from datetime import timedelta
         expiring_date = today + timedelta(days=30)
         licenses = licenses.filter(expiry_date__lte=expiring_date, expiry_date__gt=today)
     
@@ -867,23 +943,25 @@ def software_licenses_view(request):
     vendors = Vendor.objects.all().order_by('name')
     license_types = SoftwareLicense.objects.values_list('license_type', flat=True).distinct()
     
-    # Get statistics
-    total_licenses = SoftwareLicense.objects.count()
-    active_licenses = SoftwareLicense.objects.filter(
-        Q(expiry_date__isnull=True) | Q(expiry_date__gt=today)
-    ).count()
-    expired_licenses = SoftwareLicense.objects.filter(expiry_date__lt=today).count()
-    from datetime import timedelta
-    expiring_soon = SoftwareLicense.objects.filter(
-        expiry_date__lte=today + timedelta(days=30),
-        expiry_date__gt=today
-    ).count()
+    # Get statistics (one pass over the license table)
+    license_stats = SoftwareLicense.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(expiry_date__isnull=True) | Q(expiry_date__gt=today)),
+        expired=Count('id', filter=Q(expiry_date__lt=today)),
+        expiring_soon=Count('id', filter=Q(
+            expiry_date__lte=today + timedelta(days=30),
+            expiry_date__gt=today
+        )),
+        total_cost=Sum('cost'),
+    )
+    total_licenses = license_stats['total']
+    active_licenses = license_stats['active']
+    expired_licenses = license_stats['expired']
+    expiring_soon = license_stats['expiring_soon']
     
     # Calculate total installations
     total_installations = SoftwareInstallation.objects.count()
-    total_cost = SoftwareLicense.objects.aggregate(
-        total=models.Sum('cost')
-    )['total'] or 0
+    total_cost = license_stats['total_cost'] or 0
     
     context = {
         'user': request.user,
@@ -907,8 +985,6 @@ def software_licenses_view(request):
 
 @login_required
 def software_license_detail_view(request, license_id):
-    from itms_app.models import SoftwareLicense, SoftwareInstallation, Asset
-    
     license = get_object_or_404(SoftwareLicense, id=license_id)
     
     # Get installations for this license
@@ -1006,8 +1082,6 @@ def software_license_detail_view(request, license_id):
 
 @login_required
 def create_software_license_view(request):
-    from itms_app.models import SoftwareLicense, Vendor
-    
     if request.method == 'POST':
         name = request.POST.get('name', '').strip()
         version = request.POST.get('version', '').strip()
@@ -1055,13 +1129,13 @@ def create_software_license_view(request):
         
         if purchase_date:
             try:
-                purchase_dt = datetime.strptime(purchase_date, '%Y-%m-%d').date()
+                purchase_dt = parse_date_input(purchase_date)
             except ValueError:
                 errors.append('Invalid purchase date format.')
         
         if expiry_date:
             try:
-                expiry_dt = datetime.strptime(expiry_date, '%Y-%m-%d').date()
+                expiry_dt = parse_date_input(expiry_date)
                 if purchase_dt and expiry_dt <= purchase_dt:
                     errors.append('Expiry date must be after purchase date.')
             except ValueError:
@@ -1095,21 +1169,10 @@ def create_software_license_view(request):
     
     # Get form options
     vendors = Vendor.objects.all().order_by('name')
-    common_license_types = [
-        'Per User',
-        'Per Device',
-        'Site License',
-        'Enterprise License',
-        'Academic License',
-        'Concurrent License',
-        'Subscription',
-        'Perpetual License'
-    ]
-    
     context = {
         'user': request.user,
         'vendors': vendors,
-        'common_license_types': common_license_types,
+        'common_license_types': COMMON_LICENSE_TYPES,
     }
     
     return render(request, 'accounts/create_software_license.html', context)
@@ -1117,8 +1180,6 @@ def create_software_license_view(request):
 
 @login_required
 def maintenance_view(request):
-    from itms_app.models import MaintenanceRecord, Asset, Vendor
-    
     # Get filter parameters
     search = request.GET.get('search', '').strip()
     asset_filter = request.GET.get('asset', '').strip()
@@ -1156,8 +1217,11 @@ def maintenance_view(request):
     
     if date_filter:
         try:
-            filter_date = datetime.strptime(date_filter, '%Y-%m-%d').date()
-            records = records.filter(maintenance_date__date=filter_date)
+            day_start, day_end = local_day_range(date_filter)
+            records = records.filter(
+                maintenance_date__gte=day_start,
+                maintenance_date__lt=day_end
+            )
         except ValueError:
             pass
     
@@ -1174,36 +1238,21 @@ def maintenance_view(request):
     ).distinct().order_by('email')
     
     # Get statistics
-    total_records = MaintenanceRecord.objects.count()
-    this_month_records = MaintenanceRecord.objects.filter(
-        maintenance_date__year=timezone.now().year,
-        maintenance_date__month=timezone.now().month
-    ).count()
+    maintenance_stats = get_maintenance_summary(timezone.now())
+    total_records = maintenance_stats['total']
+    this_month_records = maintenance_stats['this_month']
     
     # Maintenance type counts
-    preventive_count = MaintenanceRecord.objects.filter(maintenance_type='preventive').count()
-    corrective_count = MaintenanceRecord.objects.filter(maintenance_type='corrective').count()
-    emergency_count = MaintenanceRecord.objects.filter(maintenance_type='emergency').count()
-    
-    # Cost statistics
-    total_cost = MaintenanceRecord.objects.filter(
-        cost__isnull=False
-    ).aggregate(total=models.Sum('cost'))['total'] or 0
+    preventive_count = maintenance_stats['preventive']
+    corrective_count = maintenance_stats['corrective']
+    emergency_count = maintenance_stats['emergency']
     
-    avg_cost = MaintenanceRecord.objects.filter(
-        cost__isnull=False
-    ).aggregate(avg=models.Avg('cost'))['avg'] or 0
+    # Cost statistics (SUM/AVG already skip NULL costs)
+    total_cost = maintenance_stats['total_cost'] or 0
+    avg_cost = maintenance_stats['avg_cost'] or 0
     
-    # Recent maintenance (assets that need attention)
-    from datetime import timedelta
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    recent_assets = Asset.objects.filter(
-        maintenance_records__maintenance_date__gte=thirty_days_ago
-    ).distinct().count()
-    
-    overdue_assets = Asset.objects.exclude(
-        maintenance_records__maintenance_date__gte=thirty_days_ago
-    ).filter(status='active').count()
+    recent_assets = maintenance_stats['recent_assets']
+    overdue_assets = maintenance_stats['overdue_assets']
     
     context = {
         'user': request.user,
@@ -1233,8 +1282,6 @@ def maintenance_view(request):
 
 @login_required
 def create_maintenance_record_view(request):
-    from itms_app.models import MaintenanceRecord, Asset, Vendor
-    
     if request.method == 'POST':
         asset_id = request.POST.get('asset', '').strip()
         maintenance_type = request.POST.get('maintenance_type', '').strip()
@@ -1265,8 +1312,7 @@ def create_maintenance_record_view(request):
         maintenance_dt = None
         if maintenance_date:
             try:
-                maintenance_dt = datetime.strptime(maintenance_date, '%Y-%m-%dT%H:%M')
-                maintenance_dt = timezone.make_aware(maintenance_dt)
+                maintenance_dt = parse_local_datetime(maintenance_date)
             except ValueError:
                 errors.append('Invalid maintenance date format.')
         
@@ -1324,8 +1370,6 @@ def create_maintenance_record_view(request):
 
 @login_required
 def maintenance_detail_view(request, record_id):
-    from itms_app.models import MaintenanceRecord
-    
     record = get_object_or_404(MaintenanceRecord, id=record_id)
     
     # Handle record updates (for staff or record creator)
@@ -1337,6 +1381,7 @@ def maintenance_detail_view(request, record_id):
             
             if description and len(description) >= 10:
                 record.description = description
+                update_fields = ['description', 'notes', 'updated_at']
                 
                 # Update cost if provided
                 if cost:
@@ -1344,12 +1389,13 @@ def maintenance_detail_view(request, record_id):
                         cost_value = float(cost)
                         if cost_value >= 0:
                             record.cost = cost_value
+                            update_fields.append('cost')
                     except ValueError:
                         messages.error(request, 'Invalid cost format.')
                         return redirect('maintenance_detail', record_id=record.id)
                 
                 record.notes = notes
-                record.save()
+                record.save(update_fields=update_fields)
                 
                 messages.success(request, 'Maintenance record updated successfully!')
             else:
@@ -1380,9 +1426,6 @@ def maintenance_detail_view(request, record_id):
 
 @login_required
 def maintenance_schedule_view(request):
-    from itms_app.models import MaintenanceRecord, Asset
-    from datetime import timedelta
-    
     # Get upcoming and overdue maintenance
     today = timezone.now().date()
     thirty_days_ago = today - timedelta(days=30)
@@ -1411,39 +1454,35 @@ def maintenance_schedule_view(request):
         'asset', 'performed_by'
     ).order_by('-maintenance_date')[:10]
     
-    # Maintenance statistics by type for the last 30 days
+    # Per-type counts, this month's count and the 30-day cost in one pass
     last_30_days = today - timedelta(days=30)
-    recent_preventive = MaintenanceRecord.objects.filter(
-        maintenance_type='preventive',
-        maintenance_date__gte=last_30_days
-    ).count()
-    
-    recent_corrective = MaintenanceRecord.objects.filter(
-        maintenance_type='corrective',
-        maintenance_date__gte=last_30_days
-    ).count()
-    
-    recent_emergency = MaintenanceRecord.objects.filter(
-        maintenance_type='emergency',
-        maintenance_date__gte=last_30_days
-    ).count()
+    month_start = timezone.localtime().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+    recent = Q(maintenance_date__gte=last_30_days)
+    schedule_stats = MaintenanceRecord.objects.aggregate(
+        preventive=Count('id', filter=recent & Q(maintenance_type='preventive')),
+        corrective=Count('id', filter=recent & Q(maintenance_type='corrective')),
+        emergency=Count('id', filter=recent & Q(maintenance_type='emergency')),
+        this_month=Count('id', filter=Q(
+            maintenance_date__gte=month_start,
+            maintenance_date__lt=next_month_start
+        )),
+        recent_cost=Sum('cost', filter=recent),
+    )
+    recent_preventive = schedule_stats['preventive']
+    recent_corrective = schedule_stats['corrective']
+    recent_emergency = schedule_stats['emergency']
     
     # Calculate maintenance statistics with percentages
     maintenance_total = recent_preventive + recent_corrective + recent_emergency
-    preventive_percent = int((recent_preventive * 100 / maintenance_total)) if maintenance_total > 0 else 0
-    corrective_percent = int((recent_corrective * 100 / maintenance_total)) if maintenance_total > 0 else 0
-    emergency_percent = int((recent_emergency * 100 / maintenance_total)) if maintenance_total > 0 else 0
-    
-    # Calculate monthly statistics
-    this_month_maintenance = MaintenanceRecord.objects.filter(
-        maintenance_date__year=timezone.now().year,
-        maintenance_date__month=timezone.now().month
-    ).count()
+    # Every part is 0 when the total is 0, so a divisor of 1 gives 0% there too
+    percent_base = maintenance_total or 1
+    preventive_percent = int(recent_preventive * 100 / percent_base)
+    corrective_percent = int(recent_corrective * 100 / percent_base)
+    emergency_percent = int(recent_emergency * 100 / percent_base)
     
-    # Calculate recent maintenance cost
-    recent_maintenance_cost = MaintenanceRecord.objects.filter(
-        maintenance_date__gte=last_30_days
-    ).aggregate(total_cost=models.Sum('cost'))['total_cost'] or 0
+    this_month_maintenance = schedule_stats['this_month']
+    recent_maintenance_cost = schedule_stats['recent_cost'] or 0
     
     context = {
         'user': request.user,
@@ -1468,10 +1507,6 @@ def maintenance_schedule_view(request):
 
 @login_required
 def vendors_view(request):
-    from itms_app.models import Vendor, Asset, SoftwareLicense, MaintenanceRecord
-    from django.db.models import Count, Sum, Q
-    from django.core.paginator import Paginator
-    
     # Get filter parameters
     search = request.GET.get('search', '').strip()
     has_assets = request.GET.get('has_assets', '').strip()
@@ -1514,36 +1549,31 @@ def vendors_view(request):
         vendors = vendors.filter(maintenance_count=0)
     
     # Apply sorting
-    sort_options = {
-        'name': 'name',
-        'assets': '-assets_count',
-        'licenses': '-licenses_count',
-        'maintenance': '-maintenance_count',
-        'cost': '-total_license_cost'
-    }
-    if sort_by in sort_options:
-        vendors = vendors.order_by(sort_options[sort_by])
-    else:
-        vendors = vendors.order_by('name')
+    vendors = vendors.order_by(VENDOR_SORT_OPTIONS.get(sort_by, 'name'))
     
     # Pagination
     paginator = Paginator(vendors, 12)
     page_number = request.GET.get('page', 1)
     vendors_page = paginator.get_page(page_number)
     
-    # Calculate statistics
-    total_vendors = Vendor.objects.count()
-    vendors_with_assets = Vendor.objects.annotate(
-        assets_count=Count('asset')
-    ).filter(assets_count__gt=0).count()
-    
-    vendors_with_licenses = Vendor.objects.annotate(
-        licenses_count=Count('softwarelicense')
-    ).filter(licenses_count__gt=0).count()
-    
-    vendors_with_maintenance = Vendor.objects.annotate(
-        maintenance_count=Count('maintenancerecord')
-    ).filter(maintenance_count__gt=0).count()
+    # Calculate statistics (one pass over vendors with EXISTS probes on the
+    # vendor FK indexes, instead of a GROUP BY per related table)
+    vendor_stats = Vendor.objects.aggregate(
+        total=Count('id'),
+        with_assets=Count('id', filter=Exists(
+            Asset.objects.filter(vendor=OuterRef('pk'))
+        )),
+        with_licenses=Count('id', filter=Exists(
+            SoftwareLicense.objects.filter(vendor=OuterRef('pk'))
+        )),
+        with_maintenance=Count('id', filter=Exists(
+            MaintenanceRecord.objects.filter(vendor=OuterRef('pk'))
+        )),
+    )
+    total_vendors = vendor_stats['total']
+    vendors_with_assets = vendor_stats['with_assets']
+    vendors_with_licenses = vendor_stats['with_licenses']
+    vendors_with_maintenance = vendor_stats['with_maintenance']
     
     total_license_spending = SoftwareLicense.objects.aggregate(
         total=Sum('cost')
@@ -1574,11 +1604,6 @@ def vendors_view(request):
 
 @login_required
 def vendor_detail_view(request, vendor_id):
-    from itms_app.models import Vendor, Asset, SoftwareLicense, MaintenanceRecord
-    from django.db.models import Sum, Q
-    from django.shortcuts import get_object_or_404
-    from datetime import datetime, timedelta
-    
     vendor = get_object_or_404(Vendor, id=vendor_id)
     
     # Check if user can edit (staff users only)
@@ -1586,14 +1611,17 @@ def vendor_detail_view(request, vendor_id):
     
     # Handle form submission for editing
     if request.method == 'POST' and can_edit:
-        vendor.name = request.POST.get('name', vendor.name)
-        vendor.contact_person = request.POST.get('contact_person', vendor.contact_person)
-        vendor.email = request.POST.get('email', vendor.email)
-        vendor.phone = request.POST.get('phone', vendor.phone)
-        vendor.address = request.POST.get('address', vendor.address)
+        # Only fields that were submitted and actually differ get written
+        changed_fields = [
+            field for field in VENDOR_EDITABLE_FIELDS
+            if field in request.POST and request.POST[field] != getattr(vendor, field)
+        ]
+        for field in changed_fields:
+            setattr(vendor, field, request.POST[field])
         
         try:
-            vendor.save()
+            if changed_fields:
+                vendor.save(update_fields=[*changed_fields, 'updated_at'])
             messages.success(request, 'Vendor information updated successfully!')
             return redirect('vendor_detail', vendor_id=vendor.id)
         except Exception as e:
@@ -1615,7 +1643,9 @@ def vendor_detail_view(request, vendor_id):
     maintenance_spending = maintenance_records.aggregate(total=Sum('cost'))['total'] or 0
     
     # Recent activity (last 30 days)
-    last_30_days = timezone.now() - timedelta(days=30)
+    now = timezone.now()
+    today = now.date()
+    last_30_days = now - timedelta(days=30)
     recent_maintenance = MaintenanceRecord.objects.filter(
         vendor=vendor,
         maintenance_date__gte=last_30_days
@@ -1624,10 +1654,10 @@ def vendor_detail_view(request, vendor_id):
     # License statistics
     total_license_value = license_spending
     active_licenses = licenses.filter(
-        Q(expiry_date__isnull=True) | Q(expiry_date__gte=timezone.now().date())
+        Q(expiry_date__isnull=True) | Q(expiry_date__gte=today)
     ).count()
     expired_licenses = licenses.filter(
-        expiry_date__lt=timezone.now().date()
+        expiry_date__lt=today
     ).count()
     
     context = {
@@ -1653,8 +1683,6 @@ def vendor_detail_view(request, vendor_id):
 
 @login_required
 def create_vendor_view(request):
-    from itms_app.models import Vendor
-    
     if request.method == 'POST':
         errors = []
         form_data = request.POST
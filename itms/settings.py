@@ -91,13 +91,15 @@ AUTH_USER_MODEL = 'accounts.User'
 
 # Authentication backends
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
+    'accounts.backends.EmailOrUsernameBackend',
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    # ETag from the response body; answers 304 when If-None-Match matches
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -183,6 +185,16 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 20,
 }
 
+# Faster JSON rendering when orjson is available
+try:
+    import orjson
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+        'itms_app.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ]
+except ImportError:
+    pass
+
 # JWT Settings
 from datetime import timedelta
 SIMPLE_JWT = {
@@ -222,6 +234,13 @@ except ImportError:
         }
     }
 
+# TTL tiers (seconds) for cached API responses, see itms_app/cache.py
+CACHE_TTL = {
+    'short': 30,     # live counters (asset/ticket status breakdowns)
+    'normal': 120,   # lists that change a few times a day
+    'long': 600,     # near-static reference data
+}
+
 # Session Configuration
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'
@@ -339,7 +358,11 @@ HEALTH_CHECK = {
 
 # Performance Settings
 if not DEBUG:
-    # Enable template caching
+    # Enable template caching: compiled templates (including the login page)
+    # stay in memory instead of being re-read and re-parsed on every request.
+    # Django rejects APP_DIRS together with explicit loaders, so the
+    # app_directories loader is listed here instead.
+    TEMPLATES[0]['APP_DIRS'] = False
     TEMPLATES[0]['OPTIONS']['loaders'] = [
         ('django.template.loaders.cached.Loader', [
             'django.template.loaders.filesystem.Loader',
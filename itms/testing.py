@@ -0,0 +1,26 @@
+"""
+Shared helpers for the test suites of the project apps
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def make_user(username, email, password='secret-pass', **extra):
+    return get_user_model().objects.create_user(
+        username=username, email=email, password=password,
+        first_name='Test', last_name='User', **extra,
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheTestCase(TestCase):
+    """
+    TestCase ที่ใช้ locmem cache แทน Redis และล้าง cache ก่อนทุก test
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
@@ -1,6 +1,8 @@
 from django.contrib import admin
 from django.apps import apps
 from django.utils.html import format_html
+from django.db.models import IntegerField, Max
+from django.db.models.functions import Cast, Substr
 from django.utils import timezone
 from .models import (
     # Core Asset Management
@@ -32,14 +34,42 @@ from .models import (
 )
 
 # Custom app labels for organized admin grouping
+APP_DISPLAY_NAMES = {
+    'itms_app': 'ITMS - IT Management System',
+    'accounts': 'User Management',
+    'auth': 'Authentication & Authorization'
+}
+
+# Colors for the asset status column, shared by the asset admin views
+ASSET_STATUS_COLORS = {
+    'active': '#28a745',
+    'inactive': '#dc3545',
+    'maintenance': '#ffc107',
+    'retired': '#6c757d',
+    'disposed': '#343a40'
+}
+
+def next_asset_tag():
+    """
+    Next auto-generated tag for this year (ITMS-<year>-<nnnn>, more digits
+    past 9999), continuing from the highest existing one rather than counting
+    rows, so deleted assets don't cause a tag to be handed out twice
+    """
+    prefix = f'ITMS-{timezone.localdate().year}-'
+    # Compare the suffix as a number: as strings, ITMS-2024-9999 sorts after
+    # ITMS-2024-10000 and the sequence would get stuck
+    last_sequence = Asset.objects.filter(
+        asset_tag__startswith=prefix,
+        asset_tag__regex=r'^ITMS-\d{4}-\d{4,}$'
+    ).aggregate(
+        last=Max(Cast(Substr('asset_tag', len(prefix) + 1), IntegerField()))
+    )['last']
+    sequence = (last_sequence or 0) + 1
+    return f'{prefix}{sequence:04d}'
+
 def get_app_display_name(app_label):
     """Get display name for app label"""
-    app_names = {
-        'itms_app': 'ITMS - IT Management System',
-        'accounts': 'User Management',
-        'auth': 'Authentication & Authorization'
-    }
-    return app_names.get(app_label, app_label.title())
+    return APP_DISPLAY_NAMES.get(app_label, app_label.title())
 
 # Configure admin site
 admin.site.site_header = "ITMS Administration"
@@ -86,6 +116,8 @@ class AssetAdminComplex(AssetInventoryAdminMixin, admin.ModelAdmin):
         'asset_tag', 'name', 'category', 'status_display', 'condition', 
         'location', 'assigned_to', 'warranty_status', 'purchase_cost'
     ]
+    # assigned_to is nullable, so the admin's default select_related() skips it
+    list_select_related = ['category', 'location', 'assigned_to']
     
     # Enhanced list filters
     list_filter = [
@@ -245,14 +277,7 @@ class AssetAdminComplex(AssetInventoryAdminMixin, admin.ModelAdmin):
     # Custom display methods
     def status_display(self, obj):
         """Enhanced status display with colors"""
-        status_colors = {
-            'active': '#28a745',
-            'inactive': '#dc3545',
-            'maintenance': '#ffc107',
-            'retired': '#6c757d',
-            'disposed': '#343a40'
-        }
-        color = status_colors.get(obj.status, '#6c757d')
+        color = ASSET_STATUS_COLORS.get(obj.status, '#6c757d')
         return format_html(
             '<span style="color: {}; font-weight: bold;">{}</span>',
             color,
@@ -323,10 +348,7 @@ class AssetAdminComplex(AssetInventoryAdminMixin, admin.ModelAdmin):
         """Add custom save logic if needed"""
         # Auto-generate asset tag if not provided
         if not obj.asset_tag and not change:
-            from datetime import datetime
-            year = datetime.now().year
-            count = Asset.objects.filter(created_at__year=year).count() + 1
-            obj.asset_tag = f'ITMS-{year}-{count:04d}'
+            obj.asset_tag = next_asset_tag()
         
         super().save_model(request, obj, form, change)
 
@@ -340,6 +362,7 @@ class AssetAdmin(AssetInventoryAdminMixin, admin.ModelAdmin):
         'asset_tag', 'name', 'category', 'status_display', 'condition', 
         'location', 'assigned_to', 'purchase_cost'
     ]
+    list_select_related = ['category', 'location', 'assigned_to']
     
     # List filters
     list_filter = [
@@ -479,14 +502,7 @@ class AssetAdmin(AssetInventoryAdminMixin, admin.ModelAdmin):
     # Custom display methods
     def status_display(self, obj):
         """Enhanced status display with colors"""
-        status_colors = {
-            'active': '#28a745',
-            'inactive': '#dc3545',
-            'maintenance': '#ffc107',
-            'retired': '#6c757d',
-            'disposed': '#343a40'
-        }
-        color = status_colors.get(obj.status, '#6c757d')
+        color = ASSET_STATUS_COLORS.get(obj.status, '#6c757d')
         return format_html(
             '<span style="color: {}; font-weight: bold;">{}</span>',
             color,
@@ -530,16 +546,14 @@ class AssetAdmin(AssetInventoryAdminMixin, admin.ModelAdmin):
         """Add custom save logic"""
         # Auto-generate asset tag if not provided
         if not obj.asset_tag and not change:
-            from datetime import datetime
-            year = datetime.now().year
-            count = Asset.objects.filter(created_at__year=year).count() + 1
-            obj.asset_tag = f'ITMS-{year}-{count:04d}'
+            obj.asset_tag = next_asset_tag()
         
         super().save_model(request, obj, form, change)
 
 @admin.register(MaintenanceRecord)
 class MaintenanceRecordAdmin(AssetInventoryAdminMixin, admin.ModelAdmin):
     list_display = ['asset', 'maintenance_type', 'maintenance_date', 'performed_by', 'cost']
+    list_select_related = ['asset', 'performed_by']
     list_filter = ['maintenance_type', 'maintenance_date', 'performed_by']
     search_fields = ['asset__name', 'asset__asset_tag']
     date_hierarchy = 'maintenance_date'
@@ -570,6 +584,7 @@ class ServiceManagementAdminMixin:
 @admin.register(HelpDeskTicket)
 class HelpDeskTicketAdmin(ServiceManagementAdminMixin, admin.ModelAdmin):
     list_display = ['ticket_number', 'title', 'priority', 'status', 'requester', 'assigned_to']
+    list_select_related = ['requester', 'assigned_to']
     list_filter = ['priority', 'status', 'category', 'created_at']
     search_fields = ['ticket_number', 'title', 'description']
     readonly_fields = ['ticket_number', 'created_at']
@@ -578,6 +593,7 @@ class HelpDeskTicketAdmin(ServiceManagementAdminMixin, admin.ModelAdmin):
 @admin.register(Reservation)
 class ReservationAdmin(ServiceManagementAdminMixin, admin.ModelAdmin):
     list_display = ['reservation_number', 'title', 'asset', 'reserved_by', 'status', 'start_datetime']
+    list_select_related = ['asset', 'reserved_by']
     list_filter = ['status', 'reservation_type', 'start_datetime']
     search_fields = ['reservation_number', 'title']
     readonly_fields = ['reservation_number']
@@ -4,4 +4,17 @@ from django.apps import AppConfig
 class ItmsAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'itms_app'
-    verbose_name = 'ITMS - IT Management System'
\ No newline at end of file
+    verbose_name = 'ITMS - IT Management System'
+
+    def ready(self):
+        from .cache import track_model_versions
+        from .models import (
+            Asset, Category, HelpDeskTicket, Location, MaintenanceRecord,
+            Reservation, SecurityIncident, SoftwareLicense, Vendor,
+        )
+
+        # Invalidate cached responses and summaries whenever these models are written
+        track_model_versions(
+            Asset, Category, HelpDeskTicket, Location, MaintenanceRecord,
+            Reservation, SecurityIncident, SoftwareLicense, Vendor,
+        )
@@ -0,0 +1,126 @@
+"""
+Response cache สำหรับ read-mostly API endpoints
+
+แต่ละ model มี version counter อยู่ใน cache ซึ่งจะถูกเพิ่มทุกครั้งที่มีการ save/delete
+cache key ของ response จะรวม version ไว้ด้วย ข้อมูลเก่าจึงหมดอายุทันทีเมื่อมีการแก้ไข
+(QuerySet.update() ไม่ส่ง signal จึงอาศัย TTL เป็นขอบเขตของความล้าสมัยแทน)
+"""
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+def _version_key(model):
+    return f'itms:version:{model._meta.label_lower}'
+
+
+def get_version(key):
+    """
+    ดึงค่า version counter ที่ key (สร้างใหม่ถ้ายังไม่มีหรือถูก evict ไป)
+    """
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so a lost counter never reuses an old version
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    """
+    เพิ่ม version counter ที่ key เพื่อให้ cache key ที่สร้างจาก version เดิมหมดอายุ
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        get_version(key)
+
+
+def get_model_version(model):
+    """
+    ดึง version ปัจจุบันของ model
+    """
+    return get_version(_version_key(model))
+
+
+def bump_model_version(model):
+    """
+    เพิ่ม version ของ model เพื่อให้ cache ที่เกี่ยวข้องทั้งหมดหมดอายุ
+    """
+    bump_version(_version_key(model))
+
+
+def _bump_sender_version(sender, **kwargs):
+    # Bumping before commit would let a concurrent request cache the old rows
+    # under the new version until the TTL runs out
+    transaction.on_commit(lambda: bump_model_version(sender))
+
+
+def track_model_versions(*models):
+    """
+    ผูก post_save/post_delete ของ models เข้ากับ version counter
+    """
+    for model in models:
+        uid = f'itms-cache-version-{model._meta.label_lower}'
+        post_save.connect(_bump_sender_version, sender=model, dispatch_uid=uid)
+        post_delete.connect(_bump_sender_version, sender=model, dispatch_uid=uid)
+
+
+def _etag_matches(request, etag):
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    # Weak comparison: W/"x" and "x" refer to the same representation
+    candidates = {tag.removeprefix('W/') for tag in parse_etags(if_none_match)}
+    return '*' in candidates or etag.removeprefix('W/') in candidates
+
+
+def cached_response(policy, *models, per_user=False):
+    """
+    Decorator สำหรับ DRF view/action: cache response.data ตาม absolute URL
+    และ version ของ models ที่ response นั้นอ่านข้อมูลมา
+
+    ส่ง weak ETag ที่คำนวณจาก version (และช่วงเวลา TTL) ไปด้วย ถ้า client
+    ส่ง If-None-Match ตรงกันจะตอบ 304 โดยไม่ต้องสร้าง body
+
+    policy คือชื่อ TTL tier ใน settings.CACHE_TTL ('short', 'normal', 'long')
+    per_user=True แยก cache ตาม user สำหรับ response ที่มีข้อมูลส่วนบุคคล
+    """
+    timeout = settings.CACHE_TTL[policy]
+
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            versions = ':'.join(str(get_model_version(model)) for model in models)
+            # Scheme and host are part of the key: paginated data holds absolute
+            # next/previous links built from the request that filled the cache
+            url_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+            key = f'itms:response:{url_hash}:{versions}'
+            if per_user:
+                key = f'{key}:user:{request.user.pk}'
+
+            # Time-dependent payloads (e.g. "expiring in 30 days") may change
+            # without a write, so an ETag is only trusted for one TTL window
+            window = int(time.time() // timeout)
+            etag = 'W/"%s"' % hashlib.md5(f'{key}:{window}'.encode()).hexdigest()
+            if _etag_matches(request, etag):
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+
+            data = cache.get(key)
+            if data is not None:
+                return Response(data, headers={'ETag': etag})
+
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, timeout)
+                response['ETag'] = etag
+            return response
+        return wrapper
+    return decorator
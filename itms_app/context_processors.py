@@ -2,14 +2,42 @@
 Context processors สำหรับ Django Admin Dashboard
 เพิ่มข้อมูลที่จำเป็นสำหรับ templates
 """
+from django.conf import settings
 from django.db import connection
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta, datetime
+from operator import itemgetter
 import json
+import logging
+
+from .cache import get_model_version
+from .models import (
+    Asset, HelpDeskTicket, MaintenanceRecord, Reservation, SecurityIncident,
+    SoftwareLicense,
+)
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# Custom user model (accounts.User), so the table is not auth_user
+USER_TABLE = connection.ops.quote_name(User._meta.db_table)
+
+
+# Models the dashboard figures are read from. User counts are left out on
+# purpose (every login writes last_login), so they are only TTL-bounded
+DASHBOARD_MODELS = (
+    Asset, HelpDeskTicket, MaintenanceRecord, Reservation, SecurityIncident,
+    SoftwareLicense,
+)
+
+
+def _dashboard_cache_key():
+    versions = ':'.join(str(get_model_version(model)) for model in DASHBOARD_MODELS)
+    return f'itms:admin-dashboard:{versions}'
+
 
 def dashboard_context(request):
     """
@@ -18,49 +46,70 @@ def dashboard_context(request):
     if not request.path.startswith('/admin/'):
         return {}
     
+    # One timestamp for every query and relative time in this render
+    now = timezone.now()
+    
     try:
-        # Basic statistics
-        stats = get_dashboard_stats()
+        # Every admin page renders this context; reuse it for a short window
+        # (and drop it as soon as any of DASHBOARD_MODELS changes)
+        cache_key = _dashboard_cache_key()
+        payload = cache.get(cache_key)
         
-        # Chart data
-        chart_data = get_chart_data()
-        
-        # Recent activities
-        recent_activities = get_recent_activities()
-        
-        # System alerts
-        system_alerts = get_system_alerts()
+        if payload is None:
+            # Helpers fall back to placeholder data on errors and record them here
+            errors = []
+            
+            # Basic statistics
+            stats = get_dashboard_stats(now, errors)
+            
+            # Chart data
+            chart_data = get_chart_data(now, errors)
+            
+            # Recent activities
+            recent_activities = get_recent_activities(errors)
+            
+            # System alerts
+            system_alerts = get_system_alerts(now, errors)
+            
+            # Database info
+            db_info = get_database_info(now, errors)
+            
+            payload = {
+                'stats': stats,
+                'stats_json': json.dumps(stats),
+                'chart_data': json.dumps(chart_data),
+                'recent_activities': recent_activities,
+                'system_alerts': system_alerts,
+                'db_info': db_info,
+            }
+            # Never cache placeholder data: a transient DB error would
+            # otherwise show zeroed stats for the whole TTL
+            if not errors:
+                cache.set(cache_key, payload, settings.CACHE_TTL['short'])
         
-        # Database info
-        db_info = get_database_info()
+        return {**payload, 'current_date': now}
         
+    except Exception:
+        # Fallback data in case of errors
+        logger.exception("Error building admin dashboard context")
+        stats = get_fallback_stats()
         return {
             'stats': stats,
             'stats_json': json.dumps(stats),
-            'chart_data': json.dumps(chart_data),
-            'recent_activities': recent_activities,
-            'system_alerts': system_alerts,
-            'db_info': db_info,
-            'current_date': timezone.now(),
-        }
-        
-    except Exception as e:
-        # Fallback data in case of errors
-        return {
-            'stats': get_fallback_stats(),
-            'stats_json': json.dumps(get_fallback_stats()),
             'chart_data': json.dumps({}),
             'recent_activities': [],
             'system_alerts': [],
             'db_info': {},
-            'current_date': timezone.now(),
+            'current_date': now,
         }
 
 
-def get_dashboard_stats():
+def get_dashboard_stats(now=None, errors=None):
     """
     ดึงสถิติพื้นฐานสำหรับ Dashboard
     """
+    now = now or timezone.now()
+    
     try:
         with connection.cursor() as cursor:
             stats = {}
@@ -81,7 +130,7 @@ def get_dashboard_stats():
             stats['open_tickets'] = cursor.fetchone()[0]
             
             # Total users
-            cursor.execute("SELECT COUNT(*) FROM auth_user WHERE is_active = true")
+            cursor.execute(f"SELECT COUNT(*) FROM {USER_TABLE} WHERE is_active = true")
             stats['total_users'] = cursor.fetchone()[0]
             
             # Maintenance due (next 30 days)
@@ -91,21 +140,21 @@ def get_dashboard_stats():
                 WHERE a.warranty_expiry <= %s
                 OR (m.maintenance_date IS NOT NULL 
                     AND m.maintenance_date <= %s - INTERVAL '90 days')
-            """, [timezone.now() + timedelta(days=30), timezone.now()])
+            """, [now + timedelta(days=30), now])
             stats['maintenance_due'] = cursor.fetchone()[0]
             
             # Licenses expiring
             cursor.execute("""
                 SELECT COUNT(*) FROM itms_app_softwarelicense 
                 WHERE expiry_date <= %s AND expiry_date > %s
-            """, [timezone.now() + timedelta(days=30), timezone.now()])
+            """, [now + timedelta(days=30), now])
             stats['licenses_expiring'] = cursor.fetchone()[0]
             
             # Security incidents (last 30 days)
             cursor.execute("""
                 SELECT COUNT(*) FROM itms_app_securityincident 
                 WHERE discovered_date >= %s
-            """, [timezone.now() - timedelta(days=30)])
+            """, [now - timedelta(days=30)])
             stats['security_incidents'] = cursor.fetchone()[0]
             
             # Pending approvals (reservations)
@@ -126,28 +175,32 @@ def get_dashboard_stats():
                 FROM itms_app_helpdeskticket 
                 WHERE resolved_at IS NOT NULL 
                 AND created_at >= %s
-            """, [timezone.now() - timedelta(days=30)])
+            """, [now - timedelta(days=30)])
             result = cursor.fetchone()[0]
             stats['avg_resolution_time'] = round(result if result else 0, 1)
             
             # Active sessions (simplified - just logged in users in last hour)
-            cursor.execute("""
-                SELECT COUNT(*) FROM auth_user 
+            cursor.execute(f"""
+                SELECT COUNT(*) FROM {USER_TABLE} 
                 WHERE last_login >= %s
-            """, [timezone.now() - timedelta(hours=1)])
+            """, [now - timedelta(hours=1)])
             stats['active_sessions'] = cursor.fetchone()[0]
             
             return stats
             
-    except Exception as e:
-        print(f"Error getting dashboard stats: {e}")
+    except Exception:
+        logger.exception("Error getting dashboard stats")
+        if errors is not None:
+            errors.append("dashboard stats")
         return get_fallback_stats()
 
 
-def get_chart_data():
+def get_chart_data(now=None, errors=None):
     """
     ดึงข้อมูลสำหรับ Charts
     """
+    now = now or timezone.now()
+    
     try:
         with connection.cursor() as cursor:
             chart_data = {}
@@ -162,7 +215,7 @@ def get_chart_data():
                 FROM itms_app_helpdeskticket 
                 WHERE created_at >= %s
                 GROUP BY priority
-            """, [timezone.now() - timedelta(days=30)])
+            """, [now - timedelta(days=30)])
             
             priority_data = dict(cursor.fetchall())
             chart_data['ticketPriority'] = {
@@ -174,8 +227,10 @@ def get_chart_data():
             
             return chart_data
             
-    except Exception as e:
-        print(f"Error getting chart data: {e}")
+    except Exception:
+        logger.exception("Error getting chart data")
+        if errors is not None:
+            errors.append("chart data")
         return {
             'assetStatus': [65, 72, 80, 75, 88, 95],
             'maintenance': [15, 18, 12, 20, 15, 10],
@@ -183,7 +238,7 @@ def get_chart_data():
         }
 
 
-def get_recent_activities():
+def get_recent_activities(errors=None):
     """
     ดึงกิจกรรมล่าสุด
     """
@@ -192,10 +247,10 @@ def get_recent_activities():
     try:
         with connection.cursor() as cursor:
             # Recent asset additions
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT a.name, a.created_at, u.username, u.first_name, u.last_name
                 FROM itms_app_asset a
-                LEFT JOIN auth_user u ON a.assigned_to_id = u.id
+                LEFT JOIN {USER_TABLE} u ON a.assigned_to_id = u.id
                 ORDER BY a.created_at DESC
                 LIMIT 5
             """)
@@ -211,10 +266,10 @@ def get_recent_activities():
                 })
             
             # Recent tickets
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT t.title, t.created_at, u.username, u.first_name, u.last_name, t.priority
                 FROM itms_app_helpdeskticket t
-                LEFT JOIN auth_user u ON t.requester_id = u.id
+                LEFT JOIN {USER_TABLE} u ON t.requester_id = u.id
                 ORDER BY t.created_at DESC
                 LIMIT 3
             """)
@@ -230,18 +285,22 @@ def get_recent_activities():
                 })
             
             # Sort by timestamp
-            activities.sort(key=lambda x: x['timestamp'], reverse=True)
+            activities.sort(key=itemgetter('timestamp'), reverse=True)
             return activities[:8]  # Return top 8
             
-    except Exception as e:
-        print(f"Error getting recent activities: {e}")
+    except Exception:
+        logger.exception("Error getting recent activities")
+        if errors is not None:
+            errors.append("recent activities")
         return []
 
 
-def get_system_alerts():
+def get_system_alerts(now=None, errors=None):
     """
     ดึงการแจ้งเตือนระบบ
     """
+    now = now or timezone.now()
+    
     alerts = []
     
     try:
@@ -260,14 +319,14 @@ def get_system_alerts():
                     'icon': 'exclamation-triangle',
                     'title': 'High Priority Tickets',
                     'message': f'{high_tickets} high priority tickets require attention',
-                    'created_at': timezone.now() - timedelta(minutes=30)
+                    'created_at': now - timedelta(minutes=30)
                 })
             
             # Assets needing maintenance
             cursor.execute("""
                 SELECT COUNT(*) FROM itms_app_asset 
                 WHERE warranty_expiry <= %s AND warranty_expiry > %s
-            """, [timezone.now() + timedelta(days=30), timezone.now()])
+            """, [now + timedelta(days=30), now])
             maintenance_needed = cursor.fetchone()[0]
             
             if maintenance_needed > 0:
@@ -277,7 +336,7 @@ def get_system_alerts():
                     'icon': 'wrench',
                     'title': 'Maintenance Due',
                     'message': f'{maintenance_needed} assets require maintenance soon',
-                    'created_at': timezone.now() - timedelta(hours=2)
+                    'created_at': now - timedelta(hours=2)
                 })
             
             # Security incidents
@@ -294,20 +353,24 @@ def get_system_alerts():
                     'icon': 'shield-alt',
                     'title': 'Security Incidents',
                     'message': f'{security_incidents} open security incidents',
-                    'created_at': timezone.now() - timedelta(hours=1)
+                    'created_at': now - timedelta(hours=1)
                 })
             
             return alerts
             
-    except Exception as e:
-        print(f"Error getting system alerts: {e}")
+    except Exception:
+        logger.exception("Error getting system alerts")
+        if errors is not None:
+            errors.append("system alerts")
         return []
 
 
-def get_database_info():
+def get_database_info(now=None, errors=None):
     """
     ดึงข้อมูลฐานข้อมูล PostgreSQL
     """
+    now = now or timezone.now()
+    
     try:
         with connection.cursor() as cursor:
             db_info = {}
@@ -331,12 +394,14 @@ def get_database_info():
             db_info['connections'] = cursor.fetchone()[0]
             
             # Last backup (mock data - would be real in production)
-            db_info['last_backup'] = timezone.now() - timedelta(hours=6)
+            db_info['last_backup'] = now - timedelta(hours=6)
             
             return db_info
             
-    except Exception as e:
-        print(f"Error getting database info: {e}")
+    except Exception:
+        logger.exception("Error getting database info")
+        if errors is not None:
+            errors.append("database info")
         return {
             'version': 'Unknown',
             'size': 'Unknown',
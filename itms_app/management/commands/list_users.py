@@ -0,0 +1,34 @@
+"""
+Management command สำหรับแสดงรายชื่อผู้ใช้ทั้งหมด
+ใช้คำสั่ง: python manage.py list_users
+"""
+
+from django.core.management.base import BaseCommand
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'List all users with their admin flags'
+
+    def handle(self, *args, **options):
+        lines = ['=== All Users ===']
+        separator = '-' * 30
+
+        users = User.objects.values_list(
+            'username', 'email', 'is_superuser', 'is_staff', 'is_active'
+        ).iterator()
+
+        for username, email, is_superuser, is_staff, is_active in users:
+            lines.append(
+                f'Username: {username}\n'
+                f'Email: {email}\n'
+                f'Is superuser: {is_superuser}\n'
+                f'Is staff: {is_staff}\n'
+                f'Is active: {is_active}\n'
+                f'{separator}'
+            )
+
+        self.stdout.write('\n'.join(lines))
+        self.stdout.flush()
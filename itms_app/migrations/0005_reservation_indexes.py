@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('itms_app', '0004_asset_asset_image_asset_barcode_asset_condition_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['asset', 'status', 'start_datetime'], name='itms_app_re_asset_i_1b96c5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['status', 'start_datetime'], name='itms_app_re_status_cdf898_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['start_datetime'], name='itms_app_re_start_d_3ac35b_idx'),
+        ),
+    ]
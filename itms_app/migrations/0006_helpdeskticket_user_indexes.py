@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('itms_app', '0005_reservation_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='helpdeskticket',
+            index=models.Index(fields=['requester', '-created_at'], name='itms_app_he_request_eecfab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='helpdeskticket',
+            index=models.Index(fields=['assigned_to', '-created_at'], name='itms_app_he_assigne_48b8c7_idx'),
+        ),
+    ]
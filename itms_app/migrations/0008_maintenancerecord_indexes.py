@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('itms_app', '0007_asset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='maintenancerecord',
+            index=models.Index(fields=['asset', '-maintenance_date'], name='itms_app_ma_asset_i_3f0b85_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerecord',
+            index=models.Index(fields=['maintenance_date'], name='itms_app_ma_mainten_8315a0_idx'),
+        ),
+    ]
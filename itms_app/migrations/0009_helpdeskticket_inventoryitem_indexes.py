@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('itms_app', '0008_maintenancerecord_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='helpdeskticket',
+            index=models.Index(fields=['status', 'priority'], name='itms_app_he_status_a0d08e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='helpdeskticket',
+            index=models.Index(fields=['category', 'status'], name='itms_app_he_categor_eeaab7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventoryitem',
+            index=models.Index(fields=['item_type', 'item_code'], name='itms_app_in_item_ty_535ae6_idx'),
+        ),
+    ]
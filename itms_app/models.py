@@ -181,6 +181,12 @@ class Asset(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Status filter on the asset list/API, newest first
+            models.Index(fields=['status', '-created_at']),
+            # Combined category + status filter
+            models.Index(fields=['category', 'status']),
+        ]
 
 
 class MaintenanceRecord(models.Model):
@@ -206,6 +212,12 @@ class MaintenanceRecord(models.Model):
 
     class Meta:
         ordering = ['-maintenance_date']
+        indexes = [
+            # Per-asset history (latest first) and last-maintenance lookups
+            models.Index(fields=['asset', '-maintenance_date']),
+            # Date-range filters and the default ordering of the list
+            models.Index(fields=['maintenance_date']),
+        ]
 
 
 class SoftwareLicense(models.Model):
@@ -303,6 +315,14 @@ class HelpDeskTicket(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # "My tickets" lists: one user's tickets, newest first
+            models.Index(fields=['requester', '-created_at']),
+            models.Index(fields=['assigned_to', '-created_at']),
+            # Status/priority and category/status filters on the list views and API
+            models.Index(fields=['status', 'priority']),
+            models.Index(fields=['category', 'status']),
+        ]
 
 
 class Reservation(models.Model):
@@ -415,6 +435,14 @@ class Reservation(models.Model):
                 name='end_datetime_after_start_datetime'
             )
         ]
+        indexes = [
+            # Conflict check: same asset, pending/approved, overlapping window
+            models.Index(fields=['asset', 'status', 'start_datetime']),
+            # Pending/approved/active counters on the reservations page
+            models.Index(fields=['status', 'start_datetime']),
+            # Day filter on the reservations list
+            models.Index(fields=['start_datetime']),
+        ]
 
 
 # ===============================
@@ -969,6 +997,10 @@ class InventoryItem(models.Model):
 
     class Meta:
         ordering = ['item_code']
+        indexes = [
+            # Item type filter in the admin, already in item_code order
+            models.Index(fields=['item_type', 'item_code']),
+        ]
 
 
 class PurchaseRequest(models.Model):
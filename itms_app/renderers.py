@@ -0,0 +1,29 @@
+"""
+DRF renderers สำหรับ ITMS API
+"""
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer ที่ใช้ orjson (native serialization ของ dict/list/datetime/UUID)
+
+    Types ที่ orjson ไม่รู้จัก (Decimal, lazy translation strings, QuerySet ฯลฯ)
+    ส่งต่อให้ JSONEncoder ของ DRF เหมือน JSONRenderer เดิม
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(
+            data,
+            default=_fallback_encoder.default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
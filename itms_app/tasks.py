@@ -2,8 +2,10 @@ import os
 import logging
 from datetime import datetime, timedelta
 from celery import shared_task
+from django.core.cache import cache
 from django.core.management import call_command
 from django.conf import settings
+from django.db import connection
 
 logger = logging.getLogger(__name__)
 
@@ -14,12 +16,10 @@ def health_check_task():
     """
     try:
         # Check database connectivity
-        from django.db import connection
         with connection.cursor() as cursor:
             cursor.execute("SELECT 1")
         
         # Check cache connectivity
-        from django.core.cache import cache
         cache.set('health_check', 'ok', 10)
         cache_status = cache.get('health_check')
         
@@ -0,0 +1,136 @@
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework import status, viewsets
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from itms.testing import CacheTestCase, make_user
+
+from .admin import next_asset_tag
+from .cache import bump_model_version, cached_response
+from .models import Asset, Category, Location
+from .widgets import ColorPickerWidget, DateTimePickerWidget, TagWidget
+
+
+class CategoryNamesViewSet(viewsets.ViewSet):
+    calls = 0
+
+    @cached_response('short', Category)
+    def list(self, request):
+        type(self).calls += 1
+        return Response(sorted(Category.objects.values_list('name', flat=True)))
+
+
+class CategoryNamesTestCase(CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        CategoryNamesViewSet.calls = 0
+        self.factory = APIRequestFactory()
+        self.view = CategoryNamesViewSet.as_view({'get': 'list'})
+        self.user = make_user('somchai', 'somchai@example.com')
+        with self.captureOnCommitCallbacks(execute=True):
+            Category.objects.create(name='Laptop')
+
+    def get(self, **extra):
+        request = self.factory.get('/categories/names/', **extra)
+        force_authenticate(request, user=self.user)
+        return self.view(request)
+
+
+class CachedResponseTests(CategoryNamesTestCase):
+    def test_second_request_is_served_from_cache(self):
+        self.get()
+        second = self.get()
+
+        self.assertEqual(second.data, ['Laptop'])
+        self.assertEqual(CategoryNamesViewSet.calls, 1)
+
+    def test_bump_model_version_invalidates_cache(self):
+        self.get()
+        # Bypass the post_save signal so only the explicit bump can invalidate
+        Category.objects.bulk_create([Category(name='Monitor')])
+        self.assertEqual(self.get().data, ['Laptop'])
+
+        bump_model_version(Category)
+
+        self.assertEqual(self.get().data, ['Laptop', 'Monitor'])
+        self.assertEqual(CategoryNamesViewSet.calls, 2)
+
+    def test_save_bumps_version_only_on_commit(self):
+        self.get()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            Category.objects.create(name='Monitor')
+        self.assertEqual(self.get().data, ['Laptop'])
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.get().data, ['Laptop', 'Monitor'])
+
+
+class ConditionalResponseTests(CategoryNamesTestCase):
+    def test_matching_if_none_match_returns_304(self):
+        etag = self.get()['ETag']
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(CategoryNamesViewSet.calls, 1)
+
+    def test_strong_form_of_etag_matches(self):
+        etag = self.get()['ETag']
+        response = self.get(HTTP_IF_NONE_MATCH=etag.removeprefix('W/'))
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_stale_if_none_match_returns_body(self):
+        etag = self.get()['ETag']
+        bump_model_version(Category)
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, ['Laptop'])
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class NextAssetTagTests(TestCase):
+    def setUp(self):
+        self.prefix = f'ITMS-{timezone.localdate().year}-'
+        self.category = Category.objects.create(name='Laptop')
+        self.location = Location.objects.create(name='HQ', address='Bangkok')
+
+    def add_asset(self, tag):
+        Asset.objects.create(asset_tag=tag, name=tag, category=self.category, location=self.location)
+
+    def test_first_tag_of_the_year(self):
+        self.assertEqual(next_asset_tag(), f'{self.prefix}0001')
+
+    def test_continues_from_highest_tag(self):
+        self.add_asset(f'{self.prefix}0007')
+        self.add_asset(f'{self.prefix}0003')
+        self.add_asset('ITMS-1999-0100')
+        self.add_asset(f'{self.prefix}custom')
+
+        self.assertEqual(next_asset_tag(), f'{self.prefix}0008')
+
+    def test_orders_suffix_numerically_past_9999(self):
+        self.add_asset(f'{self.prefix}9999')
+        self.assertEqual(next_asset_tag(), f'{self.prefix}10000')
+
+        self.add_asset(f'{self.prefix}10000')
+        self.assertEqual(next_asset_tag(), f'{self.prefix}10001')
+
+
+class WidgetInputTypeTests(SimpleTestCase):
+    def test_color_picker_renders_color_input(self):
+        html = ColorPickerWidget().render('color', '#ffffff')
+        self.assertInHTML('<input type="color" name="color" value="#ffffff">', html)
+
+    def test_datetime_picker_renders_datetime_local_input(self):
+        html = DateTimePickerWidget().render('when', None)
+        self.assertInHTML('<input type="datetime-local" name="when" class="datetime-picker">', html)
+
+    def test_caller_type_overrides_default(self):
+        widget = TagWidget(attrs={'type': 'search'})
+        self.assertEqual(widget.input_type, 'search')
+        self.assertNotIn('type', widget.attrs)
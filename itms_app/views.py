@@ -1,9 +1,12 @@
+from datetime import date, timedelta
+
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db.models import Q, Count
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from drf_spectacular.openapi import OpenApiParameter, OpenApiTypes
+from .cache import cached_response
 from .models import (
     Category, Location, Vendor, Asset, MaintenanceRecord,
     SoftwareLicense, SoftwareInstallation, HelpDeskTicket
@@ -59,22 +62,6 @@ class AssetViewSet(viewsets.ModelViewSet):
     serializer_class = AssetSerializer
     permission_classes = [permissions.IsAuthenticated]
     
-    def get_permissions(self):
-        """
-        Instantiates and returns the list of permissions that this view requires.
-        """
-        if self.action in ['list', 'retrieve']:
-            # Allow read operations for authenticated users
-            permission_classes = [permissions.IsAuthenticated]
-        elif self.action in ['create', 'update', 'partial_update', 'destroy']:
-            # Allow write operations for authenticated users
-            # You can add more specific permissions here if needed
-            permission_classes = [permissions.IsAuthenticated]
-        else:
-            permission_classes = [permissions.IsAuthenticated]
-        
-        return [permission() for permission in permission_classes]
-    
     def perform_create(self, serializer):
         """
         Custom create logic - you can add any business logic here
@@ -88,7 +75,8 @@ class AssetViewSet(viewsets.ModelViewSet):
         serializer.save()
 
     def get_queryset(self):
-        queryset = Asset.objects.all()
+        # The serializer reads category/location/assigned_to names for every row
+        queryset = Asset.objects.select_related('category', 'location', 'assigned_to')
         
         # Filter parameters
         category = self.request.query_params.get('category', None)
@@ -115,13 +103,23 @@ class AssetViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    # Rows embed category/location names, so those versions are part of the key.
+    # User names are left to the short TTL: last_login saves would churn the key
+    @cached_response('short', Asset, Category, Location)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     @action(detail=False, methods=['get'])
+    @cached_response('short', Asset)
     def by_status(self, request):
-        status_counts = {}
-        for status_choice in Asset.ASSET_STATUS_CHOICES:
-            status = status_choice[0]
-            count = Asset.objects.filter(status=status).count()
-            status_counts[status] = count
+        # One GROUP BY instead of a COUNT per status; order_by() drops the
+        # default ordering so it doesn't leak into the grouping
+        counts = dict(
+            Asset.objects.order_by().values_list('status').annotate(Count('id'))
+        )
+        status_counts = {
+            value: counts.get(value, 0) for value, _ in Asset.ASSET_STATUS_CHOICES
+        }
         return Response(status_counts)
 
 
@@ -131,7 +129,7 @@ class MaintenanceRecordViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        queryset = MaintenanceRecord.objects.all()
+        queryset = MaintenanceRecord.objects.select_related('asset', 'performed_by')
         asset = self.request.query_params.get('asset', None)
         maintenance_type = self.request.query_params.get('maintenance_type', None)
         
@@ -149,7 +147,7 @@ class SoftwareLicenseViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        queryset = SoftwareLicense.objects.all()
+        queryset = SoftwareLicense.objects.select_related('vendor')
         name = self.request.query_params.get('name', None)
         vendor = self.request.query_params.get('vendor', None)
         
@@ -161,13 +159,14 @@ class SoftwareLicenseViewSet(viewsets.ModelViewSet):
         return queryset
 
     @action(detail=False, methods=['get'])
+    @cached_response('normal', SoftwareLicense, Vendor)
     def expiring_soon(self, request):
-        from datetime import date, timedelta
-        thirty_days = date.today() + timedelta(days=30)
-        expiring_licenses = SoftwareLicense.objects.filter(
-            expiry_date__lte=thirty_days,
-            expiry_date__gte=date.today()
-        )
+        today = date.today()
+        expiring_licenses = SoftwareLicense.objects.select_related('vendor').filter(
+            expiry_date__lte=today + timedelta(days=30),
+            expiry_date__gte=today
+        ).order_by('expiry_date', 'id')
+        # Consumers expect a bare JSON list here, so this action stays unpaginated
         serializer = self.get_serializer(expiring_licenses, many=True)
         return Response(serializer.data)
 
@@ -178,7 +177,9 @@ class SoftwareInstallationViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        queryset = SoftwareInstallation.objects.all()
+        queryset = SoftwareInstallation.objects.select_related(
+            'software_license', 'asset', 'installed_by'
+        )
         software = self.request.query_params.get('software', None)
         asset = self.request.query_params.get('asset', None)
         
@@ -196,7 +197,9 @@ class HelpDeskTicketViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        queryset = HelpDeskTicket.objects.all()
+        queryset = HelpDeskTicket.objects.select_related(
+            'requester', 'assigned_to', 'category', 'asset'
+        )
         status = self.request.query_params.get('status', None)
         priority = self.request.query_params.get('priority', None)
         assigned_to = self.request.query_params.get('assigned_to', None)
@@ -213,11 +216,19 @@ class HelpDeskTicketViewSet(viewsets.ModelViewSet):
             
         return queryset
 
+    # Tickets carry requester/assignee details, so each user gets their own
+    # cached pages; single-ticket retrieve is deliberately left uncached
+    @cached_response('short', HelpDeskTicket, Category, Asset, per_user=True)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     @action(detail=False, methods=['get'])
+    @cached_response('short', HelpDeskTicket)
     def dashboard_stats(self, request):
-        stats = {}
-        for status_choice in HelpDeskTicket.STATUS_CHOICES:
-            status = status_choice[0]
-            count = HelpDeskTicket.objects.filter(status=status).count()
-            stats[status] = count
+        counts = dict(
+            HelpDeskTicket.objects.order_by().values_list('status').annotate(Count('id'))
+        )
+        stats = {
+            value: counts.get(value, 0) for value, _ in HelpDeskTicket.STATUS_CHOICES
+        }
         return Response(stats)
\ No newline at end of file
@@ -3,11 +3,41 @@ Custom Widgets สำหรับ Django Admin
 """
 from django import forms
 from django.contrib.admin.widgets import AdminFileWidget, AdminTextareaWidget
+from django.template.loader import get_template
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
+from types import MappingProxyType
 import json
 
+def _merge_attrs(defaults, attrs):
+    """
+    Merge caller attrs over the class defaults into one fresh dict
+    """
+    return {**defaults, **attrs} if attrs else dict(defaults)
+
+
+def static_media(cls):
+    """
+    Build the widget's Media once per class instead of on every access
+
+    ``MediaDefiningClass`` installs a fresh ``media`` property on each widget
+    class, so this wraps that property after class creation rather than
+    living in a mixin.
+    """
+    build_media = cls.media.fget
 
+    def _media(self):
+        media = cls.__dict__.get('_static_media')
+        if media is None:
+            media = build_media(self)
+            cls._static_media = media
+        return media
+
+    cls.media = property(_media)
+    return cls
+
+
+@static_media
 class RichTextWidget(AdminTextareaWidget):
     """
     Rich Text Editor Widget using TinyMCE
@@ -32,15 +62,15 @@ class RichTextWidget(AdminTextareaWidget):
         return super().render(name, value, attrs, renderer)
 
 
+@static_media
 class ColorPickerWidget(forms.TextInput):
     """
     Color Picker Widget
     """
+    _DEFAULT_ATTRS = MappingProxyType({'type': 'color'})
+
     def __init__(self, attrs=None):
-        default_attrs = {'type': 'color'}
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs))
     
     class Media:
         css = {
@@ -48,18 +78,18 @@ class ColorPickerWidget(forms.TextInput):
         }
 
 
+@static_media
 class DateTimePickerWidget(forms.DateTimeInput):
     """
     Enhanced DateTime Picker Widget
     """
+    _DEFAULT_ATTRS = MappingProxyType({
+        'type': 'datetime-local',
+        'class': 'datetime-picker'
+    })
+
     def __init__(self, attrs=None):
-        default_attrs = {
-            'type': 'datetime-local',
-            'class': 'datetime-picker'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs, format='%Y-%m-%dT%H:%M')
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs), format='%Y-%m-%dT%H:%M')
     
     class Media:
         css = {
@@ -68,18 +98,18 @@ class DateTimePickerWidget(forms.DateTimeInput):
         js = ('admin/js/datetime_picker.js',)
 
 
+@static_media
 class TagWidget(forms.TextInput):
     """
     Tag Input Widget with autocomplete
     """
+    _DEFAULT_ATTRS = MappingProxyType({
+        'class': 'tag-input',
+        'data-role': 'tagsinput'
+    })
+
     def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'tag-input',
-            'data-role': 'tagsinput'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs))
     
     class Media:
         css = {
@@ -91,19 +121,19 @@ class TagWidget(forms.TextInput):
         )
 
 
+@static_media
 class JSONEditorWidget(AdminTextareaWidget):
     """
     JSON Editor Widget with syntax highlighting
     """
+    _DEFAULT_ATTRS = MappingProxyType({
+        'class': 'json-editor',
+        'rows': 20,
+        'cols': 80
+    })
+
     def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'json-editor',
-            'rows': 20,
-            'cols': 80
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs))
     
     class Media:
         css = {
@@ -117,6 +147,7 @@ class JSONEditorWidget(AdminTextareaWidget):
         )
 
 
+@static_media
 class ImagePreviewWidget(AdminFileWidget):
     """
     Image Upload Widget with Preview
@@ -125,17 +156,11 @@ class ImagePreviewWidget(AdminFileWidget):
         output = super().render(name, value, attrs, renderer)
         
         if value and hasattr(value, 'url'):
-            image_preview = format_html(
-                '<div class="image-preview">'
-                '<img src="{}" alt="Current Image" style="max-width: 200px; max-height: 200px; margin: 10px 0;"/>'
-                '<p><a href="{}" target="_blank">View Full Size</a></p>'
-                '</div>',
-                value.url,
-                value.url
-            )
-            output = format_html('{}<br/>{}', image_preview, output)
+            # Both parts are already safe: the template escapes value.url itself
+            image_preview = get_template('widgets/image_preview.html').render({'url': value.url})
+            return mark_safe(f'{image_preview}<br/>{output}')
         
-        return mark_safe(output)
+        return output
     
     class Media:
         css = {
@@ -143,17 +168,17 @@ class ImagePreviewWidget(AdminFileWidget):
         }
 
 
+@static_media
 class StatusWidget(forms.Select):
     """
     Enhanced Status Select Widget with colored options
     """
+    _DEFAULT_ATTRS = MappingProxyType({
+        'class': 'status-select'
+    })
+
     def __init__(self, attrs=None, choices=None):
-        default_attrs = {
-            'class': 'status-select'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs, choices=choices)
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs), choices=choices)
     
     def render(self, name, value, attrs=None, renderer=None):
         output = super().render(name, value, attrs, renderer)
@@ -169,19 +194,19 @@ class StatusWidget(forms.Select):
         js = ('admin/js/status_widget.js',)
 
 
+@static_media
 class AutocompleteWidget(forms.TextInput):
     """
     Autocomplete Widget for foreign key fields
     """
+    _DEFAULT_ATTRS = MappingProxyType({
+        'class': 'autocomplete-input',
+        'data-autocomplete': 'true'
+    })
+
     def __init__(self, model=None, attrs=None):
         self.model = model
-        default_attrs = {
-            'class': 'autocomplete-input',
-            'data-autocomplete': 'true'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs))
     
     class Media:
         js = ('admin/js/autocomplete.js',)
@@ -190,20 +215,20 @@ class AutocompleteWidget(forms.TextInput):
         }
 
 
+@static_media
 class MoneyWidget(forms.TextInput):
     """
     Money/Currency Input Widget
     """
     def __init__(self, attrs=None, currency='USD'):
         self.currency = currency
-        default_attrs = {
+        # Defaults depend on the currency, so they can't live on the class
+        super().__init__(attrs={
             'class': 'money-input',
             'data-currency': currency,
-            'placeholder': f'0.00 {currency}'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+            'placeholder': f'0.00 {currency}',
+            **(attrs or {})
+        })
     
     class Media:
         js = ('admin/js/money_widget.js',)
@@ -212,35 +237,22 @@ class MoneyWidget(forms.TextInput):
         }
 
 
+@static_media
 class PasswordStrengthWidget(forms.PasswordInput):
     """
     Password Input with Strength Indicator
     """
+    _DEFAULT_ATTRS = MappingProxyType({
+        'class': 'password-strength',
+        'autocomplete': 'new-password'
+    })
+
     def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'password-strength',
-            'autocomplete': 'new-password'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs))
     
     def render(self, name, value, attrs=None, renderer=None):
         output = super().render(name, value, attrs, renderer)
-        strength_indicator = format_html(
-            '<div class="password-strength-indicator">'
-            '<div class="strength-bar"><div class="strength-fill"></div></div>'
-            '<div class="strength-text">Password Strength: <span class="strength-level">Weak</span></div>'
-            '<ul class="strength-requirements">'
-            '<li data-requirement="length">At least 8 characters</li>'
-            '<li data-requirement="uppercase">One uppercase letter</li>'
-            '<li data-requirement="lowercase">One lowercase letter</li>'
-            '<li data-requirement="number">One number</li>'
-            '<li data-requirement="special">One special character</li>'
-            '</ul>'
-            '</div>'
-        )
-        return format_html('{}{}', output, strength_indicator)
+        return mark_safe(output + get_template('widgets/password_strength.html').render())
     
     class Media:
         js = ('admin/js/password_strength.js',)
@@ -249,18 +261,18 @@ class PasswordStrengthWidget(forms.PasswordInput):
         }
 
 
+@static_media
 class MultiSelectWidget(forms.SelectMultiple):
     """
     Enhanced Multiple Select Widget with search
     """
+    _DEFAULT_ATTRS = MappingProxyType({
+        'class': 'multi-select',
+        'data-placeholder': 'Select multiple options...'
+    })
+
     def __init__(self, attrs=None):
-        default_attrs = {
-            'class': 'multi-select',
-            'data-placeholder': 'Select multiple options...'
-        }
-        if attrs:
-            default_attrs.update(attrs)
-        super().__init__(attrs=default_attrs)
+        super().__init__(attrs=_merge_attrs(self._DEFAULT_ATTRS, attrs))
     
     class Media:
         css = {